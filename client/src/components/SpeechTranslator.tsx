@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef, memo } from 'react';
 import { 
   Box, Typography, Paper, Button, CircularProgress, 
   Alert, AlertTitle, Card, CardContent,
@@ -14,6 +14,23 @@ import { startSpeechTranslation, stopSpeechTranslation } from '../services/api';
 import LanguageSelector from './shared/LanguageSelector';
 import { TranslationResult } from '../types/translations';
 
+// Memoized so a new interim result only re-renders the interim card, not every finished translation
+const TranslationCard = memo(({ translation }: { translation: TranslationResult }) => (
+  <Card sx={{ mb: 2 }}>
+    <CardContent>
+      <Typography variant="body1" className="original-text">
+        {translation.originalText}
+      </Typography>
+      <Typography variant="body1" className="translated-text">
+        {translation.translatedText}
+      </Typography>
+      <Typography variant="caption" color="text.secondary">
+        {translation.timestamp.toLocaleTimeString()}
+      </Typography>
+    </CardContent>
+  </Card>
+));
+
 const SpeechTranslator: React.FC = () => {
   const { connection, connectionState } = useHubConnection();
   const [isTranslating, setIsTranslating] = useState<boolean>(false);
@@ -29,9 +46,21 @@ const SpeechTranslator: React.FC = () => {
   const [fullTranslatedText, setFullTranslatedText] = useState<string>('');
   const [copySuccess, setCopySuccess] = useState<string | null>(null);
 
+  // Interim results can arrive many times per frame; only the latest is rendered, at most once per frame
+  const pendingInterimRef = useRef<TranslationResult | null>(null);
+  const interimFrameRef = useRef<number | null>(null);
+
   useEffect(() => {
     if (!connection) return;
 
+    const cancelPendingInterim = () => {
+      if (interimFrameRef.current !== null) {
+        cancelAnimationFrame(interimFrameRef.current);
+        interimFrameRef.current = null;
+      }
+      pendingInterimRef.current = null;
+    };
+
     // Handle connected event
     connection.on('Connected', (message: string) => {
       console.log('Connected to hub:', message);
@@ -56,6 +85,7 @@ const SpeechTranslator: React.FC = () => {
         };
 
         setTranslations(prev => [...prev, newTranslation]);
+        cancelPendingInterim();
         setInterimTranslation(null); // Clear interim once we have final
       }
     );
@@ -73,7 +103,13 @@ const SpeechTranslator: React.FC = () => {
           timestamp: new Date()
         };
 
-        setInterimTranslation(interimResult);
+        pendingInterimRef.current = interimResult;
+        if (interimFrameRef.current === null) {
+          interimFrameRef.current = requestAnimationFrame(() => {
+            interimFrameRef.current = null;
+            setInterimTranslation(pendingInterimRef.current);
+          });
+        }
       }
     );
 
@@ -87,6 +123,7 @@ const SpeechTranslator: React.FC = () => {
     // Handle translation ended
     connection.on('TranslationEnded', () => {
       setIsTranslating(false);
+      cancelPendingInterim();
       setInterimTranslation(null);
     });
 
@@ -105,6 +142,7 @@ const SpeechTranslator: React.FC = () => {
       connection.off('ReceiveFullTranslation');
       connection.off('TranslationEnded');
       connection.off('TranslationError');
+      cancelPendingInterim();
     };
   }, [connection]);
 
@@ -238,19 +276,7 @@ const SpeechTranslator: React.FC = () => {
           </Typography>
         ) : (
           translations.map((translation) => (
-            <Card key={translation.id} sx={{ mb: 2 }}>
-              <CardContent>
-                <Typography variant="body1" className="original-text">
-                  {translation.originalText}
-                </Typography>
-                <Typography variant="body1" className="translated-text">
-                  {translation.translatedText}
-                </Typography>
-                <Typography variant="caption" color="text.secondary">
-                  {translation.timestamp.toLocaleTimeString()}
-                </Typography>
-              </CardContent>
-            </Card>
+            <TranslationCard key={translation.id} translation={translation} />
           ))
         )}
       </Box>
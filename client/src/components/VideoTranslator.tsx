@@ -38,6 +38,33 @@ interface AudioTranscription {
   isFullText?: boolean;
 }
 
+// Encoder bitrate for live microphone audio; speech stays intelligible well below music bitrates
+const SPEECH_AUDIO_BITS_PER_SECOND = 32000;
+
+// Capture the microphone in the format the speech service recognizes (16kHz mono) instead of
+// the 44.1/48kHz stereo default, so every recorded and uploaded chunk carries far fewer samples.
+// These are `ideal` values, so browsers that cannot honour them fall back rather than failing.
+const SPEECH_AUDIO_CONSTRAINTS: MediaTrackConstraints = {
+  channelCount: { ideal: 1 },
+  sampleRate: { ideal: 16000 }
+};
+
+// Merge newly detected texts into the existing list, dropping repeats of the same
+// original text in a single pass (a Set lookup instead of a findIndex scan per item)
+// and, when a `limit` is given, keeping only the most recent `limit` entries.
+const mergeUniqueTexts = (prev: DetectedText[], incoming: DetectedText[], limit?: number): DetectedText[] => {
+  const seen = new Set<string>();
+  const merged: DetectedText[] = [];
+
+  for (const text of [...prev, ...incoming]) {
+    if (seen.has(text.originalText)) continue;
+    seen.add(text.originalText);
+    merged.push(text);
+  }
+
+  return limit === undefined ? merged : merged.slice(-limit);
+};
+
 // Create memoized components for better performance
 const DetectedTextItem = memo(({ text }: { text: DetectedText }) => (
   <Box sx={{ mb: 2, pb: 2, borderBottom: '1px solid #eee' }}>
@@ -118,10 +145,15 @@ const VideoTranslator: React.FC = () => {
   // Add new state for audio recording
   const [audioRecorder, setAudioRecorder] = useState<MediaRecorder | null>(null);
   const [isRecordingAudio, setIsRecordingAudio] = useState<boolean>(false);
-  const [audioChunks, setAudioChunks] = useState<Blob[]>([]);
+  // Recorded blobs live in a ref so each 100ms data event is a plain push, not a state copy + re-render
+  const audioChunksRef = useRef<Blob[]>([]);
+  // Number of recorded chunks already sent for live recognition
+  const audioChunksSentRef = useRef<number>(0);
   const audioIntervalRef = useRef<number | null>(null);
 
   const canvasRef = useRef<HTMLCanvasElement>(null);
+  // One decoder image for all frames; assigning a new src drops a frame that hasn't finished loading
+  const frameImageRef = useRef<HTMLImageElement | null>(null);
   const videoRef = useRef<HTMLVideoElement>(null);
   const captureCanvasRef = useRef<HTMLCanvasElement>(null);
   const audioScrollRef = useRef<HTMLDivElement>(null);
@@ -196,7 +228,8 @@ const VideoTranslator: React.FC = () => {
         boundingBox
       };
       
-      setDetectedTexts(prev => [...prev, newText]);
+      // The same on-screen lines are re-detected on every analysed frame; keep one entry per text
+      setDetectedTexts(prev => mergeUniqueTexts(prev, [newText]));
     });
 
     // Add handler for real-time frame processing response
@@ -205,15 +238,8 @@ const VideoTranslator: React.FC = () => {
       
       // Update detected texts
       if (detectedTexts && detectedTexts.length > 0) {
-        setDetectedTexts(prev => {
-          // Filter out duplicates and keep only recent texts (last 30)
-          const combinedTexts = [...prev, ...detectedTexts];
-          // Remove duplicates by comparing original text
-          const uniqueTexts = combinedTexts.filter((text, index, self) => 
-            index === self.findIndex(t => t.originalText === text.originalText)
-          );
-          return uniqueTexts.slice(-30);
-        });
+        // Filter out duplicates and keep only recent texts (last 30)
+        setDetectedTexts(prev => mergeUniqueTexts(prev, detectedTexts, 30));
       }
       
       // Signal that we can process the next frame
@@ -241,14 +267,15 @@ const VideoTranslator: React.FC = () => {
         
         // Check for duplicates before adding
         setAudioTranscriptions(prev => {
-          // Check if this exact text was just added in the last second (to avoid duplicates)
-          const isDuplicate = prev.some(item => 
-            item.originalText === original && 
-            item.translatedText === translated &&
-            Date.now() - item.timestamp.getTime() < 1000
-          );
-          
-          if (isDuplicate) return prev;
+          // Check if this exact text was just added in the last second (to avoid duplicates).
+          // Entries are appended in time order, so only the tail can fall inside the window.
+          const cutoff = newTranscription.timestamp.getTime() - 1000;
+          for (let i = prev.length - 1; i >= 0 && prev[i].timestamp.getTime() > cutoff; i--) {
+            if (prev[i].originalText === original && prev[i].translatedText === translated) {
+              return prev;
+            }
+          }
+
           return [...prev, newTranscription];
         });
       }
@@ -322,10 +349,14 @@ const VideoTranslator: React.FC = () => {
     
     if (!ctx) return;
     
-    const img = new Image();
+    if (!frameImageRef.current) frameImageRef.current = new Image();
+    const img = frameImageRef.current;
     img.onload = () => {
-      canvas.width = img.width;
-      canvas.height = img.height;
+      // Resizing reallocates and clears the canvas, so only do it when the frame size changes
+      if (canvas.width !== img.width || canvas.height !== img.height) {
+        canvas.width = img.width;
+        canvas.height = img.height;
+      }
       ctx.drawImage(img, 0, 0);
     };
     img.src = `data:image/jpeg;base64,${frameData}`;
@@ -394,7 +425,7 @@ const VideoTranslator: React.FC = () => {
       // Get user media with video and audio for transcription
       const stream = await navigator.mediaDevices.getUserMedia({ 
         video: true,
-        audio: true  // Make sure audio is enabled
+        audio: SPEECH_AUDIO_CONSTRAINTS  // Make sure audio is enabled
       });
       
       console.log("Camera access granted, stream obtained");
@@ -471,14 +502,15 @@ const VideoTranslator: React.FC = () => {
       
       // Get supported MIME type or use browser default
       const mimeType = getSupportedMimeType();
-      let recorderOptions = undefined;
+      // Speech only needs a low bitrate, which keeps every uploaded chunk small
+      const recorderOptions: MediaRecorderOptions = { audioBitsPerSecond: SPEECH_AUDIO_BITS_PER_SECOND };
       
       try {
         if (mimeType) {
-          recorderOptions = { mimeType };
+          recorderOptions.mimeType = mimeType;
           console.log("Creating MediaRecorder with options:", recorderOptions);
         } else {
-          console.log("Creating MediaRecorder with default options");
+          console.log("Creating MediaRecorder with default container, options:", recorderOptions);
         }
         
         // Create audio recorder from stream
@@ -486,10 +518,11 @@ const VideoTranslator: React.FC = () => {
         setAudioRecorder(recorder);
         
         const chunks: Blob[] = [];
+        audioChunksRef.current = chunks;
+        audioChunksSentRef.current = 0;
         recorder.ondataavailable = (e) => {
           if (e.data && e.data.size > 0) {
             chunks.push(e.data);
-            setAudioChunks(prevChunks => [...prevChunks, e.data]);
             console.log(`Audio data chunk received: ${e.data.size} bytes`);
           }
         };
@@ -498,7 +531,7 @@ const VideoTranslator: React.FC = () => {
           console.log('Audio recorder stopped, processing chunks');
           if (chunks.length > 0) {
             await processAudioChunks(chunks);
-            setAudioChunks([]);
+            audioChunksRef.current = [];
           }
         };
         
@@ -546,17 +579,18 @@ const VideoTranslator: React.FC = () => {
           setAudioRecorder(fallbackRecorder);
           
           const fallbackChunks: Blob[] = [];
+          audioChunksRef.current = fallbackChunks;
+          audioChunksSentRef.current = 0;
           fallbackRecorder.ondataavailable = (e) => {
             if (e.data && e.data.size > 0) {
               fallbackChunks.push(e.data);
-              setAudioChunks(prevChunks => [...prevChunks, e.data]);
             }
           };
           
           fallbackRecorder.onstop = async () => {
             if (fallbackChunks.length > 0) {
               await processAudioChunks(fallbackChunks);
-              setAudioChunks([]);
+              audioChunksRef.current = [];
             }
           };
           
@@ -588,18 +622,19 @@ const VideoTranslator: React.FC = () => {
     }
   };
   
-  // Process the latest audio chunk with better error handling
+  // Send the audio recorded since the last send, with better error handling
   const processLatestAudioChunk = async () => {
-    if (audioChunks.length === 0) return;
+    const audioChunks = audioChunksRef.current;
+    // Only the first chunk carries the container header, so every window starts with it
+    // followed by the chunks not sent yet; a lone later chunk can't be decoded
+    const firstUnsent = Math.max(1, audioChunksSentRef.current);
+    if (audioChunks.length === 0 || (audioChunksSentRef.current > 0 && audioChunks.length <= firstUnsent)) return;
     
     try {
-      const latestChunk = audioChunks[audioChunks.length - 1];
-      if (latestChunk.size < 100) {
-        console.log("Audio chunk too small, skipping processing");
-        return;
-      }
+      const audioWindow = [audioChunks[0], ...audioChunks.slice(firstUnsent)];
+      audioChunksSentRef.current = audioChunks.length;
       
-      await processAudioChunks([latestChunk]);
+      await processAudioChunks(audioWindow);
     } catch (err) {
       console.error("Error processing audio chunk:", err);
     }
@@ -611,18 +646,19 @@ const VideoTranslator: React.FC = () => {
     
     try {
       console.log(`Processing ${chunks.length} audio chunks`);
-      
+
+      // Skip small audio that likely doesn't contain speech before concatenating anything
+      const totalSize = chunks.reduce((sum, chunk) => sum + chunk.size, 0);
+      if (totalSize < 1000) {
+        console.log("Audio blob too small, skipping");
+        return;
+      }
+
       // Create a blob from all chunks - get the MIME type from the first chunk
       const mimeType = chunks[0].type || 'audio/webm';
       const audioBlob = new Blob(chunks, { type: mimeType });
       console.log(`Created audio blob of type ${mimeType}, size: ${audioBlob.size} bytes`);
       
-      // Skip small audio blobs that likely don't contain speech
-      if (audioBlob.size < 1000) {
-        console.log("Audio blob too small, skipping");
-        return;
-      }
-      
       // Convert to base64
       const reader = new FileReader();
       reader.readAsDataURL(audioBlob);
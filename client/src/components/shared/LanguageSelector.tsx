@@ -1,5 +1,6 @@
 import React from 'react';
 import { FormControl, InputLabel, Select, MenuItem, SelectChangeEvent } from '@mui/material';
+import { LANGUAGES } from '../../constants/languages';
 
 interface LanguageSelectorProps {
   label: string;
@@ -8,28 +9,14 @@ interface LanguageSelectorProps {
   disabled?: boolean;
 }
 
-const LanguageSelector: React.FC<LanguageSelectorProps> = ({ label, value, onChange, disabled = false }) => {
-  const languages = [
-    { code: 'ar', name: 'Arabic' },
-    { code: 'zh-Hans', name: 'Chinese (Simplified)' },
-    { code: 'zh-Hant', name: 'Chinese (Traditional)' },
-    { code: 'nl', name: 'Dutch' },
-    { code: 'en', name: 'English' },
-    { code: 'fr', name: 'French' },
-    { code: 'de', name: 'German' },
-    { code: 'hi', name: 'Hindi' },
-    { code: 'id', name: 'Indonesian' },
-    { code: 'it', name: 'Italian' },
-    { code: 'ja', name: 'Japanese' },
-    { code: 'ko', name: 'Korean' },
-    { code: 'pt', name: 'Portuguese' },
-    { code: 'ru', name: 'Russian' },
-    { code: 'es', name: 'Spanish' },
-    { code: 'tr', name: 'Turkish' },
-    { code: 'uk', name: 'Ukrainian' },
-    { code: 'vi', name: 'Vietnamese' }
-  ];
+// The options never change, so their elements are created once and shared by every selector
+const LANGUAGE_MENU_ITEMS = LANGUAGES.map(lang => (
+  <MenuItem key={lang.code} value={lang.code}>
+    {lang.name} ({lang.code})
+  </MenuItem>
+));
 
+const LanguageSelector: React.FC<LanguageSelectorProps> = ({ label, value, onChange, disabled = false }) => {
   return (
     <FormControl fullWidth disabled={disabled}>
       <InputLabel id={`${label}-label`}>{label}</InputLabel>
@@ -39,11 +26,7 @@ const LanguageSelector: React.FC<LanguageSelectorProps> = ({ label, value, onCha
         label={label}
         onChange={onChange}
       >
-        {languages.map(lang => (
-          <MenuItem key={lang.code} value={lang.code}>
-            {lang.name} ({lang.code})
-          </MenuItem>
-        ))}
+        {LANGUAGE_MENU_ITEMS}
       </Select>
     </FormControl>
   );
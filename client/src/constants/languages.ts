@@ -0,0 +1,34 @@
+export interface Language {
+  code: string;
+  name: string;
+}
+
+// Languages offered by the selectors, frozen so nothing derived from it can go stale
+export const LANGUAGES: ReadonlyArray<Readonly<Language>> = Object.freeze([
+  { code: 'ar', name: 'Arabic' },
+  { code: 'zh-Hans', name: 'Chinese (Simplified)' },
+  { code: 'zh-Hant', name: 'Chinese (Traditional)' },
+  { code: 'nl', name: 'Dutch' },
+  { code: 'en', name: 'English' },
+  { code: 'fr', name: 'French' },
+  { code: 'de', name: 'German' },
+  { code: 'hi', name: 'Hindi' },
+  { code: 'id', name: 'Indonesian' },
+  { code: 'it', name: 'Italian' },
+  { code: 'ja', name: 'Japanese' },
+  { code: 'ko', name: 'Korean' },
+  { code: 'pt', name: 'Portuguese' },
+  { code: 'ru', name: 'Russian' },
+  { code: 'es', name: 'Spanish' },
+  { code: 'tr', name: 'Turkish' },
+  { code: 'uk', name: 'Ukrainian' },
+  { code: 'vi', name: 'Vietnamese' }
+].map(lang => Object.freeze(lang)));
+
+// Constant-time lookups in either direction; names are matched case-insensitively
+const NAME_BY_CODE: ReadonlyMap<string, string> = new Map(LANGUAGES.map(lang => [lang.code, lang.name] as const));
+const CODE_BY_NAME: ReadonlyMap<string, string> = new Map(LANGUAGES.map(lang => [lang.name.toLowerCase(), lang.code] as const));
+
+export const getLanguageName = (code: string): string | undefined => NAME_BY_CODE.get(code);
+
+export const getLanguageCode = (name: string): string | undefined => CODE_BY_NAME.get(name.toLowerCase());
@@ -19,6 +19,10 @@ const HubConnectionContext = createContext<HubConnectionContextProps>({
 
 export const useHubConnection = () => useContext(HubConnectionContext);
 
+// Debug logging writes every message body (including base64 video frames) to the console,
+// so it is opt-in for troubleshooting rather than always on
+const SIGNALR_DEBUG = process.env.REACT_APP_SIGNALR_DEBUG === 'true';
+
 export const HubConnectionProvider: React.FC<{ children: React.ReactNode }> = ({ children }) => {
   const [connection, setConnection] = useState<signalR.HubConnection | null>(null);
   const [connectionState, setConnectionState] = useState<signalR.HubConnectionState>(
@@ -71,10 +75,10 @@ export const HubConnectionProvider: React.FC<{ children: React.ReactNode }> = ({
         transport: signalR.HttpTransportType.WebSockets | 
                   signalR.HttpTransportType.ServerSentEvents | 
                   signalR.HttpTransportType.LongPolling,
-        logMessageContent: true  // Enable detailed logging
+        logMessageContent: SIGNALR_DEBUG
       })
       .withAutomaticReconnect([0, 2000, 5000, 10000, 15000, 30000]) // Progressive retry strategy
-      .configureLogging(signalR.LogLevel.Debug) // Increase logging level for troubleshooting
+      .configureLogging(SIGNALR_DEBUG ? signalR.LogLevel.Debug : signalR.LogLevel.Warning)
       .build();
 
     setConnection(newConnection);
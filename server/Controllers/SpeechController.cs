@@ -5,6 +5,7 @@ using SpeechTranslator.Services;
 using System;
 using System.Collections.Generic;
 using System.IO;
+using System.Threading;
 using System.Threading.Tasks;
 
 namespace SpeechTranslator.Controllers
@@ -20,6 +21,16 @@ namespace SpeechTranslator.Controllers
         private readonly ILogger<SpeechController> _logger;
     private readonly LatencyTracker _latencyTracker;
         
+        // Upper bound on audio segments recognized at the same time
+        private const int MaxConcurrentSegments = 3;
+        
+        // Longest span of speech sent to the recognizer as one segment
+        private const double MaxSegmentSeconds = 15;
+        
+        // Audio repeated at the start of a segment that was cut mid-speech, so words at the cut aren't lost
+        private const double SegmentOverlapSeconds = 0.5;
+        private const int MaxOverlapWords = 8;
+        
         // Add a dictionary to track processed segments and prevent duplicates
         private static readonly Dictionary<string, HashSet<double>> _processedSegments = new Dictionary<string, HashSet<double>>();
         
@@ -192,8 +203,9 @@ namespace SpeechTranslator.Controllers
                 // Clear previous segment tracking for this file
                 _processedSegments.Clear();
                 
-                // Start video processing
-                var result = await _videoService.StartVideoProcessingAsync(tempFilePath, sourceLanguage, targetLanguage, _hubContext);
+                // Start video processing; an audio-only WAV upload has no frames, but its speech is still translated
+                var result = await _videoService.StartVideoProcessingAsync(tempFilePath, sourceLanguage, targetLanguage, _hubContext) ||
+                    await SpeechToTextService.IsRiffWaveAsync(tempFilePath);
                 
                 if (result)
                 {
@@ -204,32 +216,54 @@ namespace SpeechTranslator.Controllers
                         {
                             _logger.LogInformation("Starting audio extraction and processing from video");
                             
-                            // Get video duration using FFmpeg
-                            var duration = await GetVideoDurationAsync(tempFilePath);
-                            _logger.LogInformation($"Video duration: {duration} seconds");
-                            
-                            if (duration <= 0)
+                            // Decode the soundtrack once; the segments and the full-text pass both read this buffer
+                            ReadOnlyMemory<byte> pcmAudio = await _speechService.ExtractPcmAudioAsync(tempFilePath);
+                            if (pcmAudio.Length == 0)
                             {
-                                _logger.LogWarning("Could not determine video duration, processing entire audio");
+                                _logger.LogWarning("Could not decode video audio, processing entire audio");
                                 await ProcessEntireVideoAudio(tempFilePath, sourceLanguage, targetLanguage);
                                 return;
                             }
+                            
+                            // The decoded length gives the duration, so no separate ffprobe run is needed
+                            double duration = (double)pcmAudio.Length / PcmAudio.BytesPerSecond;
+                            _logger.LogInformation($"Video duration: {duration:0.0} seconds");
 
                             // Create a segment tracker for this file
                             string fileKey = Path.GetFileName(tempFilePath);
                             _processedSegments[fileKey] = new HashSet<double>();
 
-                            // Process audio in segments
-                            // For shorter videos (under 30 seconds), use 3 segments
-                            // For longer videos, use more segments
-                            int segmentCount = duration < 30 ? 3 : Math.Min(10, (int)(duration / 10));
-                            double segmentDuration = duration / segmentCount;
+                            // Cut the audio at natural pauses so words aren't split and silence isn't sent for recognition
+                            var segments = PcmAudio.SplitOnSilence(pcmAudio, MaxSegmentSeconds);
+                            int segmentCount = segments.Count;
+                            
+                            // The full-text pass doesn't depend on the segments, so recognize it alongside them
+                            // and only send it once the segments are out
+                            var fullTextRecognition = RecognizeDecodedAudio(pcmAudio);
                             
-                            _logger.LogInformation($"Processing audio in {segmentCount} segments of approximately {segmentDuration:0.0} seconds each");
+                            _logger.LogInformation($"Processing audio in {segmentCount} speech segments of up to {MaxSegmentSeconds} seconds each");
+                            
+                            // Recognize segments concurrently (bounded), but translate and
+                            // send them in order so clients still receive the speech in sequence
+                            var segmentThrottle = new SemaphoreSlim(MaxConcurrentSegments);
+                            var segmentTasks = new List<(int Index, double Duration, bool Overlaps, Task<string> Text)>();
+
+                            async Task<string> TranscribeSegmentAsync(double segmentStart, double segmentDuration)
+                            {
+                                await segmentThrottle.WaitAsync();
+                                try
+                                {
+                                    return await TranscribeAudioSegment(pcmAudio, segmentStart, segmentDuration);
+                                }
+                                finally
+                                {
+                                    segmentThrottle.Release();
+                                }
+                            }
                             
                             for (int i = 0; i < segmentCount; i++)
                             {
-                                double startTime = i * segmentDuration;
+                                var (startTime, segmentDuration) = segments[i];
                                 
                                 // Skip if this segment has already been processed
                                 if (_processedSegments[fileKey].Contains(startTime))
@@ -240,15 +274,39 @@ namespace SpeechTranslator.Controllers
                                 
                                 _processedSegments[fileKey].Add(startTime);
                                 
-                                double endTime = (i + 1) * segmentDuration;
+                                double endTime = startTime + segmentDuration;
+                                
+                                // Segments that continue straight from the previous one were cut without a pause
+                                bool overlaps = i > 0 && Math.Abs(segments[i - 1].Start + segments[i - 1].Duration - startTime) < 0.001;
+                                double leadIn = overlaps ? Math.Min(SegmentOverlapSeconds, startTime) : 0;
                                 
                                 _logger.LogInformation($"Processing audio segment {i+1}/{segmentCount} ({startTime:0.0}s to {endTime:0.0}s)");
                                 
-                                // Extract and process this audio segment
-                                string segmentText = await ExtractAndTranscribeAudioSegment(
-                                    tempFilePath, startTime, segmentDuration, sourceLanguage);
+                                // Recognize this slice of the decoded audio
+                                segmentTasks.Add((i, segmentDuration, overlaps, TranscribeSegmentAsync(startTime - leadIn, segmentDuration + leadIn)));
+                            }
+                            
+                            // Recognizers sometimes repeat a phrase across segments; only send each once
+                            var recentSegmentTexts = new RecentTextFilter();
+                            string previousSegmentText = string.Empty;
+                            
+                            foreach (var (i, segmentDuration, overlaps, segmentTextTask) in segmentTasks)
+                            {
+                                string segmentText = await segmentTextTask;
+                                
+                                // Drop the words the lead-in repeated from the end of the previous segment
+                                string recognizedText = segmentText;
+                                if (overlaps)
+                                {
+                                    segmentText = TrimRepeatedLeadIn(previousSegmentText, segmentText);
+                                }
+                                previousSegmentText = recognizedText;
                                 
-                                if (!string.IsNullOrWhiteSpace(segmentText))
+                                if (!string.IsNullOrWhiteSpace(segmentText) && !recentSegmentTexts.TryAdd(segmentText))
+                                {
+                                    _logger.LogInformation($"Skipping repeated text in segment {i+1}");
+                                }
+                                else if (!string.IsNullOrWhiteSpace(segmentText))
                                 {
                                     // Translate the segment text
                                     string translatedText = await _translationService.TranslateTextAsync(
@@ -276,7 +334,7 @@ namespace SpeechTranslator.Controllers
                             }
                             
                             // Process the entire audio as a final step
-                            await ProcessEntireVideoAudio(tempFilePath, sourceLanguage, targetLanguage, isFullText: true);
+                            await ProcessEntireVideoAudio(tempFilePath, sourceLanguage, targetLanguage, isFullText: true, fullTextRecognition: fullTextRecognition);
                             
                             // Clean up segment tracker
                             _processedSegments.Remove(fileKey);
@@ -309,99 +367,71 @@ namespace SpeechTranslator.Controllers
             }
         }
 
-        private async Task<double> GetVideoDurationAsync(string videoPath)
+        private async Task<string> TranscribeAudioSegment(ReadOnlyMemory<byte> pcmAudio, double startTime, double duration)
         {
-            try
+            // Slicing is zero-copy, so each segment costs only the recognition call
+            var segmentAudio = PcmAudio.Slice(pcmAudio, startTime, duration);
+            
+            // Skip segments that are mostly silence or background noise instead of sending them for recognition
+            if (segmentAudio.IsEmpty || !PcmAudio.ContainsSpeech(segmentAudio))
             {
-                // Use FFmpeg to get video duration
-                var processInfo = new System.Diagnostics.ProcessStartInfo
-                {
-                    FileName = "cmd.exe",
-                    Arguments = $"/C ffprobe -v error -show_entries format=duration -of default=noprint_wrappers=1:nokey=1 \"{videoPath}\"",
-                    RedirectStandardOutput = true,
-                    UseShellExecute = false,
-                    CreateNoWindow = true
-                };
-
-                var process = System.Diagnostics.Process.Start(processInfo);
-                if (process == null) return 0;
-
-                string output = await process.StandardOutput.ReadToEndAsync();
-                await process.WaitForExitAsync();
+                return string.Empty;
+            }
 
-                if (process.ExitCode == 0 && double.TryParse(output.Trim(), out double duration))
-                {
-                    return duration;
-                }
-                return 0;
+            try
+            {
+                return await _speechService.ConvertSpeechToTextAsync(segmentAudio);
             }
             catch (Exception ex)
             {
-                _logger.LogError(ex, "Error getting video duration");
-                return 0;
+                _logger.LogError(ex, "Error recognizing speech from audio segment");
+                return string.Empty;
             }
         }
 
-        private async Task<string> ExtractAndTranscribeAudioSegment(string videoPath, double startTime, double duration, string language)
+        private static string TrimRepeatedLeadIn(string previousText, string text)
         {
-            try
+            var previousWords = previousText.Split((char[]?)null, StringSplitOptions.RemoveEmptyEntries);
+            var words = text.Split((char[]?)null, StringSplitOptions.RemoveEmptyEntries);
+            
+            // Find the longest run of leading words that repeats the previous text's ending
+            for (int count = Math.Min(MaxOverlapWords, Math.Min(previousWords.Length, words.Length)); count > 0; count--)
             {
-                string segmentAudioPath = Path.Combine(
-                    Path.GetTempPath(), 
-                    $"segment_{Guid.NewGuid()}.wav"
-                );
-
-                // Extract audio segment using FFmpeg
-                var ffmpegCmd = $"ffmpeg -i \"{videoPath}\" -ss {startTime} -t {duration} " +
-                    $"-ac 1 -ar 16000 -vn -q:a 0 " +
-                    $"-af \"loudnorm=I=-16:TP=-1.5:LRA=11\" \"{segmentAudioPath}\" -y";
-
-                var processInfo = new System.Diagnostics.ProcessStartInfo
-                {
-                    FileName = "cmd.exe",
-                    Arguments = $"/C {ffmpegCmd}",
-                    RedirectStandardOutput = true,
-                    RedirectStandardError = true,
-                    UseShellExecute = false,
-                    CreateNoWindow = true
-                };
-
-                var process = System.Diagnostics.Process.Start(processInfo);
-                if (process == null) return string.Empty;
-
-                await process.WaitForExitAsync();
-
-                if (process.ExitCode != 0)
-                {
-                    string error = await process.StandardError.ReadToEndAsync();
-                    _logger.LogError($"FFmpeg error: {error}");
-                    return string.Empty;
-                }
-
-                // Process the segment audio with speech recognition
-                try
+                bool matches = true;
+                for (int j = 0; j < count && matches; j++)
                 {
-                    string recognizedText = await _speechService.ConvertSpeechToTextAsync(segmentAudioPath);
-                    
-                    // Clean up the temporary file
-                    try { System.IO.File.Delete(segmentAudioPath); } catch { }
-                    
-                    return recognizedText;
+                    matches = string.Equals(
+                        previousWords[previousWords.Length - count + j].Trim(OverlapPunctuation),
+                        words[j].Trim(OverlapPunctuation),
+                        StringComparison.OrdinalIgnoreCase);
                 }
-                catch (Exception ex)
+                
+                if (matches)
                 {
-                    _logger.LogError(ex, "Error recognizing speech from audio segment");
-                    return string.Empty;
+                    return string.Join(' ', words, count, words.Length - count);
                 }
             }
+            
+            return text;
+        }
+
+        private static readonly char[] OverlapPunctuation = { '.', ',', '!', '?', ';', ':' };
+
+        private async Task<string> RecognizeDecodedAudio(ReadOnlyMemory<byte> pcmAudio)
+        {
+            try
+            {
+                return await _speechService.ConvertSpeechToTextAsync(pcmAudio);
+            }
             catch (Exception ex)
             {
-                _logger.LogError(ex, "Error extracting audio segment");
+                // Treat unrecognizable audio the same as a video without speech
+                _logger.LogWarning($"Speech could not be recognized from the decoded video audio: {ex.Message}");
                 return string.Empty;
             }
         }
 
-        private async Task ProcessEntireVideoAudio(string videoPath, string sourceLanguage, string targetLanguage, bool isFullText = false)
+        private async Task ProcessEntireVideoAudio(string videoPath, string sourceLanguage, string targetLanguage, bool isFullText = false, Task<string>? fullTextRecognition = null)
         {
             try
             {
@@ -421,8 +451,10 @@ namespace SpeechTranslator.Controllers
                     _processedSegments[fileKey].Add(-1);
                 }
                 
-                // Extract audio from the video
-                var audioText = await _speechService.ConvertSpeechToTextFromVideoAsync(videoPath);
+                // Use the recognition the caller already started on decoded audio, otherwise extract it from the video
+                var audioText = fullTextRecognition != null
+                    ? await fullTextRecognition
+                    : await _speechService.ConvertSpeechToTextFromVideoAsync(videoPath);
                 
                 if (string.IsNullOrWhiteSpace(audioText))
                 {
@@ -470,76 +502,14 @@ namespace SpeechTranslator.Controllers
             {
                 // Try different approaches to split the text into meaningful chunks
                 
-                // Approach 1: Split by sentence ending punctuation
-                var sentenceDelimiters = new[] { ". ", "! ", "? ", ".\n", "!\n", "?\n" };
-                var sentences = new List<string>();
-                
-                int startPos = 0;
-                for (int i = 0; i < audioText.Length; i++)
-                {
-                    foreach (var delimiter in sentenceDelimiters)
-                    {
-                        if (i + delimiter.Length <= audioText.Length && 
-                            audioText.Substring(i, delimiter.Length) == delimiter)
-                        {
-                            // Found a sentence delimiter
-                            var sentence = audioText.Substring(startPos, i - startPos + 1).Trim();
-                            if (!string.IsNullOrEmpty(sentence))
-                            {
-                                sentences.Add(sentence);
-                            }
-                            startPos = i + delimiter.Length;
-                            break;
-                        }
-                    }
-                }
-                
-                // Add the last part if any remains
-                if (startPos < audioText.Length)
-                {
-                    var lastSentence = audioText.Substring(startPos).Trim();
-                    if (!string.IsNullOrEmpty(lastSentence))
-                    {
-                        sentences.Add(lastSentence);
-                    }
-                }
+                // Approach 1: Split by sentence ending punctuation (". ", "! ", "? " and their newline forms)
+                var sentences = SplitAfterPunctuation(audioText, SentenceEndings, " \n");
                 
                 // Alternative approach if no sentences were found
                 if (sentences.Count <= 1)
                 {
-                    // Approach 2: Split by commas and other punctuation
-                    var secondaryDelimiters = new[] { ", ", "; " };
-                    sentences.Clear();
-                    startPos = 0;
-                    
-                    for (int i = 0; i < audioText.Length; i++)
-                    {
-                        foreach (var delimiter in secondaryDelimiters)
-                        {
-                            if (i + delimiter.Length <= audioText.Length && 
-                                audioText.Substring(i, delimiter.Length) == delimiter)
-                            {
-                                // Found a delimiter
-                                var chunk = audioText.Substring(startPos, i - startPos + 1).Trim();
-                                if (!string.IsNullOrEmpty(chunk))
-                                {
-                                    sentences.Add(chunk);
-                                }
-                                startPos = i + delimiter.Length;
-                                break;
-                            }
-                        }
-                    }
-                    
-                    // Add the last part if any remains
-                    if (startPos < audioText.Length)
-                    {
-                        var lastChunk = audioText.Substring(startPos).Trim();
-                        if (!string.IsNullOrEmpty(lastChunk))
-                        {
-                            sentences.Add(lastChunk);
-                        }
-                    }
+                    // Approach 2: Split by commas and other punctuation (", " and "; ")
+                    sentences = SplitAfterPunctuation(audioText, ClauseSeparators, " ");
                 }
                 
                 // If we still don't have multiple chunks, create artificial ones
@@ -601,6 +571,44 @@ namespace SpeechTranslator.Controllers
             }
         }
 
+        private static readonly char[] SentenceEndings = { '.', '!', '?' };
+        private static readonly char[] ClauseSeparators = { ',', ';' };
+
+        // Splits text after every punctuation mark that is directly followed by one of the separator
+        // characters, jumping between candidate marks with IndexOfAny instead of testing each position
+        private static List<string> SplitAfterPunctuation(string text, char[] punctuation, string separators)
+        {
+            var parts = new List<string>();
+            int startPos = 0;
+            
+            for (int i = text.IndexOfAny(punctuation); i >= 0 && i + 1 < text.Length; i = text.IndexOfAny(punctuation, i + 1))
+            {
+                if (separators.IndexOf(text[i + 1]) < 0)
+                {
+                    continue;
+                }
+                
+                var part = text.Substring(startPos, i - startPos + 1).Trim();
+                if (!string.IsNullOrEmpty(part))
+                {
+                    parts.Add(part);
+                }
+                startPos = i + 2;
+            }
+            
+            // Add the last part if any remains
+            if (startPos < text.Length)
+            {
+                var lastPart = text.Substring(startPos).Trim();
+                if (!string.IsNullOrEmpty(lastPart))
+                {
+                    parts.Add(lastPart);
+                }
+            }
+            
+            return parts;
+        }
+
         [HttpPost("stop-video")]
         public async Task<IActionResult> StopVideoTranslation()
         {
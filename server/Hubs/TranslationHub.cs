@@ -1,5 +1,7 @@
 using Microsoft.AspNetCore.SignalR;
 using System;
+using System.Collections.Concurrent;
+using System.Threading;
 using System.Threading.Tasks;
 using SpeechTranslator.Services;
 using System.IO;
@@ -13,6 +15,9 @@ namespace SpeechTranslator.Hubs
         private readonly SpeechToTextService _speechService;
         private readonly TranslationService _translationService;
         
+        // Recently recognized live-audio texts per connection, used to drop repeated phrases
+        private static readonly ConcurrentDictionary<string, RecentTextFilter> _recentLiveTexts = new();
+        
         public TranslationHub(
             ILogger<TranslationHub> logger, 
             VideoProcessingService videoService,
@@ -81,6 +86,7 @@ namespace SpeechTranslator.Hubs
         public override async Task OnDisconnectedAsync(Exception? exception)
         {
             _logger.LogInformation($"Client disconnected: {Context.ConnectionId}");
+            _recentLiveTexts.TryRemove(Context.ConnectionId, out _);
             if (exception != null)
             {
                 _logger.LogError(exception, "Error during client disconnection");
@@ -95,7 +101,12 @@ namespace SpeechTranslator.Hubs
                 _logger.LogDebug("Received live video frame for processing");
                 
                 // Convert base64 string to byte array
-                byte[] frameBytes = Convert.FromBase64String(frameBase64);
+                if (!TryDecodeBase64(frameBase64, out var frameBytes))
+                {
+                    _logger.LogWarning("Received live video frame that is not valid base64, skipping");
+                    await Clients.Caller.SendAsync("VideoProcessingError", "The video frame is not valid base64 data.");
+                    return;
+                }
                 
                 // Process the frame and get results
                 var (processedFrameBase64, detectedTexts) = await _videoService.ProcessLiveFrameAsync(
@@ -121,7 +132,11 @@ namespace SpeechTranslator.Hubs
                 _logger.LogDebug($"Received live audio for processing (isFinal: {isFinal})");
                 
                 // Convert base64 string to byte array
-                byte[] audioBytes = Convert.FromBase64String(audioBase64);
+                if (!TryDecodeBase64(audioBase64, out var audioBytes))
+                {
+                    _logger.LogWarning("Received live audio that is not valid base64, skipping");
+                    return;
+                }
                 
                 // Skip tiny audio fragments that likely don't contain speech
                 if (audioBytes.Length < 1000)
@@ -130,103 +145,75 @@ namespace SpeechTranslator.Hubs
                     return;
                 }
                 
-                // Create a temporary file for the audio
-                string tempAudioFile = Path.Combine(
-                    Path.GetTempPath(),
-                    $"live_audio_{Guid.NewGuid()}.webm"
-                );
-                
                 try
                 {
-                    // Save the audio to a temporary file
-                    await File.WriteAllBytesAsync(tempAudioFile, audioBytes);
-                    
-                    // Convert webm to wav with optimized settings
-                    string wavFile = Path.ChangeExtension(tempAudioFile, ".wav");
-                    var processInfo = new System.Diagnostics.ProcessStartInfo
-                    {
-                        // Use optimized settings for speech recognition
-                        FileName = "cmd.exe",
-                        Arguments = $"/C ffmpeg -i \"{tempAudioFile}\" -ac 1 -ar 16000 -vn -acodec pcm_s16le \"{wavFile}\" -y",
-                        RedirectStandardOutput = true,
-                        RedirectStandardError = true,
-                        UseShellExecute = false,
-                        CreateNoWindow = true
-                    };
-                    
-                    var process = System.Diagnostics.Process.Start(processInfo);
-                    if (process == null)
+                    // Special handling for final chunks
+                    if (isFinal)
                     {
-                        _logger.LogError("Failed to start FFmpeg process");
-                        return;
+                        _logger.LogDebug("Processing final audio chunk");
                     }
                     
-                    // Don't wait too long for small audio chunks
-                    var waitTask = process.WaitForExitAsync();
-                    var completedTask = await Task.WhenAny(waitTask, Task.Delay(5000)); // 5 second timeout
+                    string? recognizedText;
                     
-                    if (completedTask != waitTask)
+                    // Recordings that are already 16kHz mono 16-bit PCM WAV can go straight to the recognizer
+                    if (PcmAudio.TryGetWavSamples(audioBytes, out var wavSamples))
                     {
-                        _logger.LogWarning("FFmpeg process timed out, killing process");
-                        try { process.Kill(); } catch { }
-                        return;
+                        _logger.LogDebug("Live audio is already speech-ready WAV, skipping FFmpeg conversion");
+                        
+                        // Mostly silent or noise-only audio isn't worth a recognition round trip
+                        if (!PcmAudio.ContainsSpeech(wavSamples))
+                        {
+                            _logger.LogDebug("Live audio is mostly silence, skipping recognition");
+                            return;
+                        }
+                        
+                        recognizedText = await _speechService.ConvertSpeechToTextAsync(wavSamples);
                     }
-                    
-                    if (process.ExitCode == 0)
+                    else
                     {
-                        try
+                        recognizedText = await RecognizeThroughFfmpegAsync(audioBytes);
+                        if (recognizedText == null)
                         {
-                            // Special handling for final chunks
-                            if (isFinal)
-                            {
-                                _logger.LogDebug("Processing final audio chunk");
-                            }
-                            
-                            // Process the audio with speech-to-text
-                            string recognizedText = await _speechService.ConvertSpeechToTextAsync(wavFile);
-                            
-                            if (!string.IsNullOrWhiteSpace(recognizedText))
-                            {
-                                // Translate the recognized text
-                                string translatedText = await _translationService.TranslateTextAsync(
-                                    sourceLanguage,
-                                    targetLanguage,
-                                    recognizedText
-                                );
-                                
-                                // Send back to the client
-                                await Clients.Caller.SendAsync(
-                                    isFinal ? "ReceiveFullVideoSpeechTranslation" : "ReceiveVideoSpeechTranslation",
-                                    recognizedText,
-                                    translatedText,
-                                    sourceLanguage,
-                                    targetLanguage
-                                );
-                                
-                                _logger.LogInformation($"Processed live audio{(isFinal ? " (final)" : "")}: '{recognizedText}' -> '{translatedText}'");
-                            }
-                            else
-                            {
-                                _logger.LogDebug("No speech detected in live audio segment");
-                            }
+                            return;
                         }
-                        catch (Exception ex)
+                    }
+                    
+                    if (!string.IsNullOrWhiteSpace(recognizedText))
+                    {
+                        // Overlapping chunks often yield the same phrase again; don't translate or send it twice
+                        var recentTexts = _recentLiveTexts.GetOrAdd(Context.ConnectionId, _ => new RecentTextFilter());
+                        if (!recentTexts.TryAdd(recognizedText))
                         {
-                            _logger.LogError(ex, "Error recognizing speech from audio");
+                            _logger.LogDebug($"Skipping repeated live audio text: '{recognizedText}'");
+                            return;
                         }
+                        
+                        // Translate the recognized text
+                        string translatedText = await _translationService.TranslateTextAsync(
+                            sourceLanguage,
+                            targetLanguage,
+                            recognizedText
+                        );
+                        
+                        // Send back to the client
+                        await Clients.Caller.SendAsync(
+                            isFinal ? "ReceiveFullVideoSpeechTranslation" : "ReceiveVideoSpeechTranslation",
+                            recognizedText,
+                            translatedText,
+                            sourceLanguage,
+                            targetLanguage
+                        );
+                        
+                        _logger.LogInformation($"Processed live audio{(isFinal ? " (final)" : "")}: '{recognizedText}' -> '{translatedText}'");
                     }
                     else
                     {
-                        string error = await process.StandardError.ReadToEndAsync();
-                        _logger.LogError($"FFmpeg error: {error}");
+                        _logger.LogDebug("No speech detected in live audio segment");
                     }
                 }
-                finally
+                catch (Exception ex)
                 {
-                    // Clean up temporary files
-                    try { if (File.Exists(tempAudioFile)) File.Delete(tempAudioFile); } catch { }
-                    try { if (File.Exists(Path.ChangeExtension(tempAudioFile, ".wav"))) 
-                            File.Delete(Path.ChangeExtension(tempAudioFile, ".wav")); } catch { }
+                    _logger.LogError(ex, "Error recognizing speech from audio");
                 }
             }
             catch (Exception ex)
@@ -234,5 +221,122 @@ namespace SpeechTranslator.Hubs
                 _logger.LogError(ex, "Error processing live audio");
             }
         }
+
+        private static bool TryDecodeBase64(string? base64, out byte[] bytes)
+        {
+            bytes = Array.Empty<byte>();
+            if (string.IsNullOrEmpty(base64))
+            {
+                return false;
+            }
+
+            // Malformed input is rejected without throwing. The size from length and padding is exact for
+            // canonical input, which decodes straight into it; whitespace, which Convert.FromBase64String
+            // also accepts, only makes it an upper bound and costs a trim
+            int padding = base64.Length >= 2 && base64[^1] == '=' ? (base64[^2] == '=' ? 2 : 1) : 0;
+            var buffer = new byte[(base64.Length + 3) / 4 * 3 - padding];
+            if (!Convert.TryFromBase64String(base64, buffer, out int written))
+            {
+                return false;
+            }
+
+            bytes = written == buffer.Length ? buffer : buffer[..written];
+            return true;
+        }
+
+        private async Task<string?> RecognizeThroughFfmpegAsync(byte[] audioBytes)
+        {
+            // Pipe the encoded bytes into FFmpeg's stdin and stream the 16kHz mono 16-bit samples from
+            // its stdout straight into the recognizer, so recognition overlaps with decoding
+            var processInfo = new System.Diagnostics.ProcessStartInfo
+            {
+                // Use optimized settings for speech recognition
+                FileName = SpeechToTextService.FfmpegPath,
+                ArgumentList = { "-i", "pipe:0", "-ac", "1", "-ar", "16000", "-vn", "-acodec", "pcm_s16le", "-f", "s16le", "pipe:1" },
+                RedirectStandardInput = true,
+                RedirectStandardOutput = true,
+                RedirectStandardError = true,
+                UseShellExecute = false,
+                CreateNoWindow = true
+            };
+            
+            using var process = System.Diagnostics.Process.Start(processInfo);
+            if (process == null)
+            {
+                _logger.LogError("Failed to start FFmpeg process");
+                return null;
+            }
+            
+            var stderrTask = process.StandardError.ReadToEndAsync();
+            var writeTask = WriteInputAsync(process, audioBytes);
+            var recognitionTask = _speechService.ConvertSpeechToTextAsync(process.StandardOutput.BaseStream);
+            
+            // Only decoding is time-limited; recognition may take longer and is awaited on every path below
+            bool exited;
+            using (var decodeTimeout = new CancellationTokenSource(TimeSpan.FromSeconds(5)))
+            {
+                try
+                {
+                    await process.WaitForExitAsync(decodeTimeout.Token);
+                    exited = true;
+                }
+                catch (OperationCanceledException)
+                {
+                    exited = false;
+                }
+            }
+            
+            if (!exited)
+            {
+                _logger.LogWarning("FFmpeg process timed out, killing process");
+                try { process.Kill(); } catch { }
+            }
+            
+            await writeTask;
+            
+            if (!exited || process.ExitCode != 0)
+            {
+                if (exited)
+                {
+                    string error = await stderrTask;
+                    _logger.LogError($"FFmpeg error: {error}");
+                }
+                
+                // Killing FFmpeg or its exit closes stdout, which ends the recognizer's input;
+                // wait for it so it never outlives the process it reads from
+                await ObserveAsync(recognitionTask);
+                return null;
+            }
+            
+            return await recognitionTask;
+        }
+
+        private static async Task ObserveAsync(Task task)
+        {
+            try
+            {
+                await task;
+            }
+            catch (Exception)
+            {
+                // The caller has already reported why this result is being discarded
+            }
+        }
+
+        private static async Task WriteInputAsync(System.Diagnostics.Process process, byte[] encodedAudio)
+        {
+            try
+            {
+                await process.StandardInput.BaseStream.WriteAsync(encodedAudio);
+            }
+            catch (IOException)
+            {
+                // FFmpeg closed its input early (e.g. unreadable data); the exit code reports the failure
+            }
+            finally
+            {
+                process.StandardInput.Close();
+            }
+        }
     }
 }
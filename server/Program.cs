@@ -88,6 +88,11 @@ namespace SpeechTranslator
             string? visionApiKey = Environment.GetEnvironmentVariable("VISION_API_KEY");
             string? visionEndpoint = Environment.GetEnvironmentVariable("VISION_ENDPOINT");
 
+            // Optional: raise on noisy or high-jitter setups where live phrases get cut at short pauses
+            int liveSegmentationSilenceTimeoutMs = int.TryParse(Environment.GetEnvironmentVariable("SPEECH_SEGMENTATION_SILENCE_TIMEOUT_MS"), out var silenceTimeoutMs)
+                ? Math.Clamp(silenceTimeoutMs, 100, 5000)
+                : SpeechToTextService.DefaultLiveSegmentationSilenceTimeoutMs;
+
             // Validate required configuration
             if (string.IsNullOrEmpty(speechApiKey) || string.IsNullOrEmpty(speechEndpoint))
             {
@@ -113,7 +118,8 @@ namespace SpeechTranslator
                     speechApiKey!,
                     sp.GetRequiredService<TranslationService>(),
                     sp.GetRequiredService<LatencyTracker>(),
-                    sp.GetRequiredService<ILogger<SpeechToTextService>>()
+                    sp.GetRequiredService<ILogger<SpeechToTextService>>(),
+                    liveSegmentationSilenceTimeoutMs
                 ));
             builder.Services.AddSingleton<VideoProcessingService>(sp => 
                 new VideoProcessingService(
@@ -1,6 +1,5 @@
 using System;
 using System.Collections.Generic;
-using System.Linq;
 using Microsoft.Extensions.Logging;
 
 namespace SpeechTranslator.Services
@@ -23,17 +22,17 @@ namespace SpeechTranslator.Services
         /// <summary>
         /// Historical speech-recognition latency measurements used to compute aggregate statistics.
         /// </summary>
-        private readonly List<double> _latencyMeasurements = new();
+        private readonly LatencyBucket _latencyMeasurements = new();
 
         /// <summary>
         /// Historical translation latency measurements for end-to-end monitoring.
         /// </summary>
-        private readonly List<double> _translationLatencyMeasurements = new();
+        private readonly LatencyBucket _translationLatencyMeasurements = new();
 
         /// <summary>
         /// Historical video overlay latency measurements for frame refresh monitoring.
         /// </summary>
-        private readonly List<double> _videoOverlayLatencyMeasurements = new();
+        private readonly LatencyBucket _videoOverlayLatencyMeasurements = new();
 
         /// <summary>
         /// Synchronizes access to shared state across multiple threads.
@@ -111,19 +110,7 @@ namespace SpeechTranslator.Services
         /// </summary>
         public (double Average, double P95, double P99, int TotalMeasurements) GetLatencyStats()
         {
-            List<double> snapshot;
-            lock (_lock)
-            {
-                if (!_latencyMeasurements.Any()) return (0, 0, 0, 0);
-                snapshot = new List<double>(_latencyMeasurements);
-            }
-
-            var sorted = snapshot.OrderBy(x => x).ToList();
-            var average = sorted.Average();
-            var p95 = sorted.ElementAtOrDefault((int)(sorted.Count * 0.95));
-            var p99 = sorted.ElementAtOrDefault((int)(sorted.Count * 0.99));
-            
-            return (average, p95, p99, sorted.Count);
+            return GetStats(_latencyMeasurements);
         }
         
         /// <summary>
@@ -131,12 +118,7 @@ namespace SpeechTranslator.Services
         /// </summary>
         public double GetSuccessRate()
         {
-            lock (_lock)
-            {
-                if (!_latencyMeasurements.Any()) return 0;
-                var successfulRequests = _latencyMeasurements.Count(x => x <= SuccessThresholdMs);
-                return (double)successfulRequests / _latencyMeasurements.Count * 100;
-            }
+            return GetSuccessRate(_latencyMeasurements);
         }
 
         /// <summary>
@@ -161,19 +143,7 @@ namespace SpeechTranslator.Services
         /// </summary>
         public (double Average, double P95, double P99, int TotalMeasurements) GetTranslationLatencyStats()
         {
-            List<double> snapshot;
-            lock (_lock)
-            {
-                if (!_translationLatencyMeasurements.Any()) return (0, 0, 0, 0);
-                snapshot = new List<double>(_translationLatencyMeasurements);
-            }
-
-            var sorted = snapshot.OrderBy(x => x).ToList();
-            var average = sorted.Average();
-            var p95 = sorted.ElementAtOrDefault((int)(sorted.Count * 0.95));
-            var p99 = sorted.ElementAtOrDefault((int)(sorted.Count * 0.99));
-
-            return (average, p95, p99, sorted.Count);
+            return GetStats(_translationLatencyMeasurements);
         }
 
         /// <summary>
@@ -181,12 +151,7 @@ namespace SpeechTranslator.Services
         /// </summary>
         public double GetTranslationSuccessRate()
         {
-            lock (_lock)
-            {
-                if (!_translationLatencyMeasurements.Any()) return 0;
-                var successfulRequests = _translationLatencyMeasurements.Count(x => x <= SuccessThresholdMs);
-                return (double)successfulRequests / _translationLatencyMeasurements.Count * 100;
-            }
+            return GetSuccessRate(_translationLatencyMeasurements);
         }
 
         /// <summary>
@@ -211,40 +176,67 @@ namespace SpeechTranslator.Services
         /// </summary>
         public (double Average, double P95, double P99, int TotalMeasurements) GetVideoOverlayLatencyStats()
         {
-            List<double> snapshot;
-            lock (_lock)
-            {
-                if (!_videoOverlayLatencyMeasurements.Any()) return (0, 0, 0, 0);
-                snapshot = new List<double>(_videoOverlayLatencyMeasurements);
-            }
-
-            var sorted = snapshot.OrderBy(x => x).ToList();
-            var average = sorted.Average();
-            var p95 = sorted.ElementAtOrDefault((int)(sorted.Count * 0.95));
-            var p99 = sorted.ElementAtOrDefault((int)(sorted.Count * 0.99));
-
-            return (average, p95, p99, sorted.Count);
+            return GetStats(_videoOverlayLatencyMeasurements);
         }
 
         /// <summary>
         /// Calculates the percentage of video overlays that completed within the target threshold.
         /// </summary>
         public double GetVideoOverlaySuccessRate()
+        {
+            return GetSuccessRate(_videoOverlayLatencyMeasurements);
+        }
+
+        private void RecordLatencyInternal(LatencyBucket bucket, double latencyMs)
         {
             lock (_lock)
             {
-                if (!_videoOverlayLatencyMeasurements.Any()) return 0;
-                var successfulRequests = _videoOverlayLatencyMeasurements.Count(x => x <= SuccessThresholdMs);
-                return (double)successfulRequests / _videoOverlayLatencyMeasurements.Count * 100;
+                bucket.Measurements.Add(latencyMs);
+                bucket.Sum += latencyMs;
+                if (latencyMs <= SuccessThresholdMs)
+                {
+                    bucket.SuccessCount++;
+                }
             }
         }
 
-        private void RecordLatencyInternal(List<double> bucket, double latencyMs)
+        private (double Average, double P95, double P99, int TotalMeasurements) GetStats(LatencyBucket bucket)
         {
+            double[] sorted;
+            double average;
             lock (_lock)
             {
-                bucket.Add(latencyMs);
+                if (bucket.Measurements.Count == 0) return (0, 0, 0, 0);
+                sorted = bucket.Measurements.ToArray();
+                average = bucket.Sum / sorted.Length;
             }
+
+            // Only the percentiles need the ordered values; the average comes from the running sum
+            Array.Sort(sorted);
+            var p95 = sorted[Math.Min(sorted.Length - 1, (int)(sorted.Length * 0.95))];
+            var p99 = sorted[Math.Min(sorted.Length - 1, (int)(sorted.Length * 0.99))];
+
+            return (average, p95, p99, sorted.Length);
+        }
+
+        private double GetSuccessRate(LatencyBucket bucket)
+        {
+            lock (_lock)
+            {
+                if (bucket.Measurements.Count == 0) return 0;
+                return (double)bucket.SuccessCount / bucket.Measurements.Count * 100;
+            }
+        }
+
+        /// <summary>
+        /// Measurements for one metric, with a running sum and success count so averages and
+        /// success rates are read in constant time instead of rescanning every sample.
+        /// </summary>
+        private sealed class LatencyBucket
+        {
+            public List<double> Measurements { get; } = new();
+            public double Sum { get; set; }
+            public int SuccessCount { get; set; }
         }
     }
-}
\ No newline at end of file
+}
@@ -0,0 +1,257 @@
+using System;
+using System.Buffers.Binary;
+using System.Collections.Generic;
+using System.Runtime.InteropServices;
+
+namespace SpeechTranslator.Services
+{
+    /// <summary>
+    /// Helpers for the raw 16kHz, 16-bit, mono PCM audio used for speech recognition.
+    /// </summary>
+    public static class PcmAudio
+    {
+        public const int SampleRate = 16000;
+        public const int BitsPerSample = 16;
+        public const int Channels = 1;
+        public const int BytesPerSample = BitsPerSample / 8 * Channels;
+        public const int BytesPerSecond = SampleRate * BytesPerSample;
+
+        private const ushort PcmFormatTag = 1;
+
+        // Silence detection works on 20ms frames; speech keeps a little padding so word onsets aren't clipped
+        private const int FrameMilliseconds = 20;
+        private const int FrameBytes = BytesPerSecond * FrameMilliseconds / 1000;
+        private const int SpeechPaddingMilliseconds = 100;
+        private const double DefaultSilenceThresholdDb = -40;
+
+        // Audio needs this share of voiced frames, or this much voiced time in total, to be worth recognizing
+        private const double MinSpeechFrameRatio = 0.3;
+        private const int MinSpeechMilliseconds = 300;
+
+        /// <summary>
+        /// Returns the samples between two offsets (in seconds) without copying, clamped to the buffer.
+        /// </summary>
+        public static ReadOnlyMemory<byte> Slice(ReadOnlyMemory<byte> pcm, double startSeconds, double durationSeconds)
+        {
+            int start = ToByteOffset(pcm, startSeconds);
+            int end = ToByteOffset(pcm, startSeconds + durationSeconds);
+            return pcm[start..Math.Max(start, end)];
+        }
+
+        private static int ToByteOffset(ReadOnlyMemory<byte> pcm, double seconds)
+        {
+            // Round to a whole sample so a slice never splits one in half
+            long sample = (long)Math.Round(Math.Max(0, seconds) * SampleRate);
+            return (int)Math.Min(sample * BytesPerSample, pcm.Length - pcm.Length % BytesPerSample);
+        }
+
+        /// <summary>
+        /// Splits audio into one speech span per pause of at least <paramref name="minSilenceMilliseconds"/>,
+        /// leaving silence out. Speech that runs longer than <paramref name="maxSegmentSeconds"/> without a
+        /// pause falls back to fixed windows. Returns (start, duration) in seconds.
+        /// </summary>
+        public static List<(double Start, double Duration)> SplitOnSilence(
+            ReadOnlyMemory<byte> pcm,
+            double maxSegmentSeconds,
+            double silenceThresholdDb = DefaultSilenceThresholdDb,
+            int minSilenceMilliseconds = 400)
+        {
+            var segments = new List<(double Start, double Duration)>();
+            int frameCount = pcm.Length / FrameBytes;
+            if (frameCount == 0)
+            {
+                return segments;
+            }
+
+            double thresholdSquared = ThresholdSquared(silenceThresholdDb);
+            int minSilenceFrames = Math.Max(1, minSilenceMilliseconds / FrameMilliseconds);
+            int paddingFrames = SpeechPaddingMilliseconds / FrameMilliseconds;
+            int maxFrames = Math.Max(1, (int)(maxSegmentSeconds * 1000 / FrameMilliseconds));
+
+            var samples = MemoryMarshal.Cast<byte, short>(pcm.Span[..(frameCount * FrameBytes)]);
+            int samplesPerFrame = FrameBytes / BytesPerSample;
+
+            // Collect non-silent ranges, bridging pauses shorter than the minimum silence
+            var speech = new List<(int Start, int End)>();
+            int rangeStart = -1;
+            int lastVoiced = -1;
+            for (int frame = 0; frame < frameCount; frame++)
+            {
+                if (!IsVoiced(samples.Slice(frame * samplesPerFrame, samplesPerFrame), thresholdSquared))
+                {
+                    continue;
+                }
+
+                if (rangeStart >= 0 && frame - lastVoiced > minSilenceFrames)
+                {
+                    speech.Add((rangeStart, lastVoiced + 1));
+                    rangeStart = -1;
+                }
+                if (rangeStart < 0)
+                {
+                    rangeStart = frame;
+                }
+                lastVoiced = frame;
+            }
+            if (rangeStart >= 0)
+            {
+                speech.Add((rangeStart, lastVoiced + 1));
+            }
+
+            // Keep each pause-separated range as its own segment, since single-shot recognition stops at the
+            // first pause; only ranges longer than the limit are cut, into back-to-back windows
+            int previousEnd = 0;
+            foreach (var (start, end) in speech)
+            {
+                int segmentStart = Math.Max(previousEnd, start - paddingFrames);
+                int segmentEnd = Math.Min(frameCount, end + paddingFrames);
+
+                for (; segmentEnd - segmentStart > maxFrames; segmentStart += maxFrames)
+                {
+                    AddSegment(segments, segmentStart, segmentStart + maxFrames);
+                }
+                if (segmentEnd > segmentStart)
+                {
+                    AddSegment(segments, segmentStart, segmentEnd);
+                }
+                previousEnd = segmentEnd;
+            }
+
+            return segments;
+        }
+
+        /// <summary>
+        /// Returns true when enough of the audio's 20ms frames are above the silence threshold to be worth
+        /// sending for recognition, so near-silence and isolated clicks are skipped.
+        /// </summary>
+        public static bool ContainsSpeech(ReadOnlyMemory<byte> pcm)
+        {
+            double ratio = VoicedFrameRatio(pcm);
+            double voicedMilliseconds = ratio * (pcm.Length / FrameBytes) * FrameMilliseconds;
+            return ratio >= MinSpeechFrameRatio || voicedMilliseconds >= MinSpeechMilliseconds;
+        }
+
+        /// <summary>
+        /// Returns the fraction of 20ms frames whose energy is above the silence threshold.
+        /// </summary>
+        public static double VoicedFrameRatio(ReadOnlyMemory<byte> pcm, double silenceThresholdDb = DefaultSilenceThresholdDb)
+        {
+            int frameCount = pcm.Length / FrameBytes;
+            if (frameCount == 0)
+            {
+                return 0;
+            }
+
+            double thresholdSquared = ThresholdSquared(silenceThresholdDb);
+            var samples = MemoryMarshal.Cast<byte, short>(pcm.Span[..(frameCount * FrameBytes)]);
+            int samplesPerFrame = FrameBytes / BytesPerSample;
+
+            int voiced = 0;
+            for (int frame = 0; frame < frameCount; frame++)
+            {
+                if (IsVoiced(samples.Slice(frame * samplesPerFrame, samplesPerFrame), thresholdSquared))
+                {
+                    voiced++;
+                }
+            }
+
+            return (double)voiced / frameCount;
+        }
+
+        private static double ThresholdSquared(double silenceThresholdDb)
+        {
+            // Compare mean-square energy against the squared threshold amplitude to avoid a sqrt per frame
+            double threshold = short.MaxValue * Math.Pow(10, silenceThresholdDb / 20);
+            return threshold * threshold;
+        }
+
+        private static bool IsVoiced(ReadOnlySpan<short> frame, double thresholdSquared)
+        {
+            long energy = 0;
+            foreach (short sample in frame)
+            {
+                energy += sample * sample;
+            }
+            return (double)energy / frame.Length >= thresholdSquared;
+        }
+
+        private static void AddSegment(List<(double Start, double Duration)> segments, int startFrame, int endFrame)
+        {
+            segments.Add((startFrame * FrameMilliseconds / 1000.0, (endFrame - startFrame) * FrameMilliseconds / 1000.0));
+        }
+
+        /// <summary>
+        /// Returns the sample data of a RIFF/WAVE buffer that is already 16kHz mono 16-bit PCM,
+        /// so it can be recognized without an FFmpeg conversion. Returns false for any other input.
+        /// </summary>
+        public static bool TryGetWavSamples(ReadOnlyMemory<byte> wav, out ReadOnlyMemory<byte> samples)
+        {
+            samples = ReadOnlyMemory<byte>.Empty;
+            if (!TryFindWavData(wav.Span, out int dataOffset, out uint dataLength))
+            {
+                return false;
+            }
+
+            // Streamed WAVs may carry a placeholder size, so never read past the buffer
+            long length = Math.Min(dataLength, wav.Length - dataOffset);
+            samples = wav.Slice(dataOffset, (int)length);
+            return true;
+        }
+
+        /// <summary>
+        /// Locates the data chunk of a RIFF/WAVE header that describes 16kHz mono 16-bit PCM. Only the
+        /// chunks before the samples need to be present, so a file can be checked from its first bytes.
+        /// </summary>
+        public static bool TryFindWavData(ReadOnlySpan<byte> wav, out int dataOffset, out uint dataLength)
+        {
+            dataOffset = 0;
+            dataLength = 0;
+
+            if (wav.Length < 12 || !wav[..4].SequenceEqual("RIFF"u8) || !wav.Slice(8, 4).SequenceEqual("WAVE"u8))
+            {
+                return false;
+            }
+
+            bool formatMatches = false;
+            long offset = 12;
+
+            while (offset + 8 <= wav.Length)
+            {
+                var chunkId = wav.Slice((int)offset, 4);
+                uint chunkSize = BinaryPrimitives.ReadUInt32LittleEndian(wav.Slice((int)offset + 4, 4));
+                long body = offset + 8;
+
+                if (chunkId.SequenceEqual("fmt "u8))
+                {
+                    if (chunkSize < 16 || body + 16 > wav.Length)
+                    {
+                        return false;
+                    }
+
+                    var format = wav.Slice((int)body, 16);
+                    formatMatches =
+                        BinaryPrimitives.ReadUInt16LittleEndian(format) == PcmFormatTag &&
+                        BinaryPrimitives.ReadUInt16LittleEndian(format[2..]) == Channels &&
+                        BinaryPrimitives.ReadUInt32LittleEndian(format[4..]) == SampleRate &&
+                        BinaryPrimitives.ReadUInt16LittleEndian(format[14..]) == BitsPerSample;
+                }
+                else if (chunkId.SequenceEqual("data"u8))
+                {
+                    if (!formatMatches)
+                    {
+                        return false;
+                    }
+
+                    dataOffset = (int)body;
+                    dataLength = chunkSize;
+                    return true;
+                }
+
+                // Chunks are padded to an even number of bytes
+                offset = body + chunkSize + (chunkSize & 1);
+            }
+
+            return false;
+        }
+    }
+}
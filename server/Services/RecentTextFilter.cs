@@ -0,0 +1,68 @@
+using System.Collections.Generic;
+using System.Text;
+
+namespace SpeechTranslator.Services
+{
+    /// <summary>
+    /// Remembers the last few recognized texts so phrases the recognizer repeats across
+    /// chunks (including A-B-A patterns) can be dropped instead of translated and sent again.
+    /// </summary>
+    public class RecentTextFilter
+    {
+        private readonly int _capacity;
+        private readonly Queue<string> _order = new();
+        private readonly HashSet<string> _texts = new();
+        private readonly object _lock = new();
+
+        public RecentTextFilter(int capacity = 8)
+        {
+            _capacity = capacity;
+        }
+
+        /// <summary>
+        /// Returns true and remembers the text if it is not one of the recent texts.
+        /// </summary>
+        public bool TryAdd(string text)
+        {
+            string key = Normalize(text);
+            if (key.Length == 0)
+            {
+                return false;
+            }
+
+            lock (_lock)
+            {
+                if (!_texts.Add(key))
+                {
+                    return false;
+                }
+
+                _order.Enqueue(key);
+                if (_order.Count > _capacity)
+                {
+                    _texts.Remove(_order.Dequeue());
+                }
+                return true;
+            }
+        }
+
+        private static string Normalize(string text)
+        {
+            // Compare on words only, ignoring case; any run of punctuation or spacing separates words,
+            // so "well,I" and "well I" normalize the same
+            var builder = new StringBuilder(text.Length);
+            foreach (char c in text)
+            {
+                if (char.IsLetterOrDigit(c))
+                {
+                    builder.Append(char.ToLowerInvariant(c));
+                }
+                else if (builder.Length > 0 && builder[^1] != ' ')
+                {
+                    builder.Append(' ');
+                }
+            }
+            return builder.ToString().TrimEnd();
+        }
+    }
+}
@@ -3,11 +3,13 @@ using Microsoft.CognitiveServices.Speech;
 using Microsoft.CognitiveServices.Speech.Audio;
 using SpeechTranslator.Hubs;
 using System;
+using System.Buffers;
 using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.Diagnostics;
 using System.IO;
 using System.Text;
+using System.Threading.Channels;
 using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
 
@@ -16,14 +18,33 @@ namespace SpeechTranslator.Services
     public class SpeechToTextService
     {
         private readonly SpeechConfig _speechConfig;
+        // Separate config for live microphone sessions so their end-of-phrase timing doesn't affect file recognition
+        private readonly SpeechConfig _liveSpeechConfig;
         private readonly TranslationService _translationService;
     private readonly LatencyTracker _latencyTracker;
     private readonly ILogger<SpeechToTextService> _logger;
     private enum RecognitionStage : byte { InterimPending = 0, FinalPending = 1 }
     private readonly ConcurrentDictionary<string, RecognitionStage> _activeRecognitions = new();
+
+        // Block size used when copying in-memory PCM (see PcmAudio) into a push stream
+        private const int PcmWriteBlockSize = 32 * 1024;
+
+        // RecognizeOnceAsync stops after the first utterance (or a few seconds of leading silence),
+        // so a single-shot recognition never needs more audio than this
+        private const double SingleUtteranceSeconds = 30;
+
+        // Enough of a WAV file to reach its data chunk past any metadata chunks
+        private const int WavHeaderProbeBytes = 4096;
+
+        // FFmpeg executable, resolved once so launches don't repeat the PATH search
+        public static readonly string FfmpegPath = ResolveFfmpegPath();
+
+        // Pause that ends a live phrase; shorter than the service default so finals arrive sooner
+        public const int DefaultLiveSegmentationSilenceTimeoutMs = 300;
         private SpeechRecognizer? _speechRecognizer;
-        private SpeechSynthesizer? _speechSynthesizer;
-        private bool _isListening;
+
+        // Hands recognized text from the recognizer callbacks to the session's translation stage
+        private Channel<(string Text, bool IsInterim, string ResultId)>? _recognizedTexts;
 
         // Add properties to accumulate text
         private readonly StringBuilder _accumulatedOriginalText = new();
@@ -41,7 +62,8 @@ namespace SpeechTranslator.Services
             string speechKey,
             TranslationService translationService,
             LatencyTracker latencyTracker,
-            ILogger<SpeechToTextService> logger)
+            ILogger<SpeechToTextService> logger,
+            int liveSegmentationSilenceTimeoutMs = DefaultLiveSegmentationSilenceTimeoutMs)
         {
             if (string.IsNullOrEmpty(speechEndpoint))
                 throw new ArgumentNullException(nameof(speechEndpoint));
@@ -49,10 +71,33 @@ namespace SpeechTranslator.Services
                 throw new ArgumentNullException(nameof(speechKey));
                 
             _speechConfig = SpeechConfig.FromEndpoint(new Uri(speechEndpoint), speechKey);
+            _liveSpeechConfig = SpeechConfig.FromEndpoint(new Uri(speechEndpoint), speechKey);
+            _liveSpeechConfig.SetProperty(PropertyId.Speech_SegmentationSilenceTimeoutMs, liveSegmentationSilenceTimeoutMs.ToString());
             _translationService = translationService ?? throw new ArgumentNullException(nameof(translationService));
             _latencyTracker = latencyTracker ?? throw new ArgumentNullException(nameof(latencyTracker));
             _logger = logger ?? throw new ArgumentNullException(nameof(logger));
-            _isListening = false;
+        }
+
+        private static string ResolveFfmpegPath()
+        {
+            string? configured = Environment.GetEnvironmentVariable("FFMPEG_PATH");
+            if (!string.IsNullOrWhiteSpace(configured))
+            {
+                return configured;
+            }
+
+            string executable = OperatingSystem.IsWindows() ? "ffmpeg.exe" : "ffmpeg";
+            foreach (var directory in (Environment.GetEnvironmentVariable("PATH") ?? string.Empty).Split(Path.PathSeparator, StringSplitOptions.RemoveEmptyEntries))
+            {
+                string candidate = Path.Combine(directory.Trim('"'), executable);
+                if (File.Exists(candidate))
+                {
+                    return candidate;
+                }
+            }
+
+            // Not found now; let the process launcher report it if it is still missing when used
+            return "ffmpeg";
         }
 
         public async Task<string> ConvertSpeechToTextAsync()
@@ -115,6 +160,119 @@ namespace SpeechTranslator.Services
             }
         }
 
+        public async Task<string> ConvertSpeechToTextAsync(ReadOnlyMemory<byte> pcmAudio)
+        {
+            using var pushStream = AudioInputStream.CreatePushStream(
+                AudioStreamFormat.GetWaveFormatPCM(PcmAudio.SampleRate, PcmAudio.BitsPerSample, PcmAudio.Channels));
+            using var audioConfig = AudioConfig.FromStreamInput(pushStream);
+            using var recognizer = new SpeechRecognizer(_speechConfig, audioConfig);
+            var requestId = $"pcm-{Guid.NewGuid()}";
+            _latencyTracker.StartTracking(requestId);
+            SpeechRecognitionResult? result = null;
+
+            try
+            {
+                // Only the first utterance is recognized, so don't copy a whole soundtrack into the SDK
+                WritePcm(pushStream, PcmAudio.Slice(pcmAudio, 0, SingleUtteranceSeconds));
+                pushStream.Close();
+
+                result = await recognizer.RecognizeOnceAsync();
+
+                if (result.Reason == ResultReason.RecognizedSpeech)
+                {
+                    return result.Text;
+                }
+
+                throw new Exception("Speech could not be recognized from the audio data.");
+            }
+            finally
+            {
+                var latency = _latencyTracker.EndTracking(requestId);
+                if (latency.HasValue)
+                {
+                    _logger.LogInformation("In-memory audio speech recognition latency: {Latency}ms (reason: {Reason})", latency.Value, result?.Reason);
+                }
+            }
+        }
+
+        public async Task<string> ConvertSpeechToTextAsync(Stream pcmStream)
+        {
+            using var pushStream = AudioInputStream.CreatePushStream(
+                AudioStreamFormat.GetWaveFormatPCM(PcmAudio.SampleRate, PcmAudio.BitsPerSample, PcmAudio.Channels));
+            using var audioConfig = AudioConfig.FromStreamInput(pushStream);
+            using var recognizer = new SpeechRecognizer(_speechConfig, audioConfig);
+            var requestId = $"pcm-stream-{Guid.NewGuid()}";
+            _latencyTracker.StartTracking(requestId);
+            SpeechRecognitionResult? result = null;
+
+            try
+            {
+                // Feed audio as it arrives so recognition starts before the whole input has been decoded
+                var pumpTask = PumpPcmAsync(pcmStream, pushStream);
+                try
+                {
+                    result = await recognizer.RecognizeOnceAsync();
+                }
+                finally
+                {
+                    // Always drain the source so a producer writing to it (e.g. FFmpeg) can exit
+                    await pumpTask;
+                }
+
+                if (result.Reason == ResultReason.RecognizedSpeech)
+                {
+                    return result.Text;
+                }
+
+                throw new Exception("Speech could not be recognized from the audio stream.");
+            }
+            finally
+            {
+                var latency = _latencyTracker.EndTracking(requestId);
+                if (latency.HasValue)
+                {
+                    _logger.LogInformation("Streamed audio speech recognition latency: {Latency}ms (reason: {Reason})", latency.Value, result?.Reason);
+                }
+            }
+        }
+
+        private static async Task PumpPcmAsync(Stream source, PushAudioInputStream pushStream)
+        {
+            var buffer = ArrayPool<byte>.Shared.Rent(PcmWriteBlockSize);
+            try
+            {
+                int read;
+                while ((read = await source.ReadAsync(buffer.AsMemory(0, PcmWriteBlockSize))) > 0)
+                {
+                    pushStream.Write(buffer, read);
+                }
+            }
+            finally
+            {
+                pushStream.Close();
+                ArrayPool<byte>.Shared.Return(buffer);
+            }
+        }
+
+        private static void WritePcm(PushAudioInputStream pushStream, ReadOnlyMemory<byte> pcmAudio)
+        {
+            // The push stream only accepts arrays, so feed it through a small pooled buffer
+            var buffer = ArrayPool<byte>.Shared.Rent(PcmWriteBlockSize);
+            try
+            {
+                for (int offset = 0; offset < pcmAudio.Length; offset += PcmWriteBlockSize)
+                {
+                    int count = Math.Min(PcmWriteBlockSize, pcmAudio.Length - offset);
+                    pcmAudio.Span.Slice(offset, count).CopyTo(buffer);
+                    pushStream.Write(buffer, count);
+                }
+            }
+            finally
+            {
+                ArrayPool<byte>.Shared.Return(buffer);
+            }
+        }
+
         public async Task<string> ConvertSpeechToTextFromVideoAsync(string videoFilePath)
         {
             var requestId = $"video-{Guid.NewGuid()}";
@@ -125,12 +283,17 @@ namespace SpeechTranslator.Services
             try 
             {
                 Console.WriteLine($"Extracting audio from video: {videoFilePath}");
-                string extractedAudioPath = ExtractAudioFromVideo(videoFilePath);
-                Console.WriteLine($"Audio extracted to: {extractedAudioPath}");
+                // Decode straight to memory; both attempts read the same PCM buffer instead of a WAV file on disk
+                var pcmAudio = await ExtractPcmAudioAsync(videoFilePath);
+                if (pcmAudio.IsEmpty)
+                {
+                    throw new Exception("Failed to extract audio from video.");
+                }
+                Console.WriteLine($"Audio extracted: {pcmAudio.Length} bytes of PCM");
 
                 try
                 {
-                    string firstAttempt = await ConvertSpeechToTextAsync(extractedAudioPath);
+                    string firstAttempt = await ConvertSpeechToTextAsync(pcmAudio);
                     if (!string.IsNullOrWhiteSpace(firstAttempt))
                     {
                         response = firstAttempt;
@@ -146,7 +309,12 @@ namespace SpeechTranslator.Services
                 {
                     try
                     {
-                        using var audioConfig = AudioConfig.FromWavFileInput(extractedAudioPath);
+                        using var pushStream = AudioInputStream.CreatePushStream(
+                            AudioStreamFormat.GetWaveFormatPCM(PcmAudio.SampleRate, PcmAudio.BitsPerSample, PcmAudio.Channels));
+                        using var audioConfig = AudioConfig.FromStreamInput(pushStream);
+                        WritePcm(pushStream, PcmAudio.Slice(pcmAudio, 0, SingleUtteranceSeconds));
+                        pushStream.Close();
+                        
                         var specializedConfig = SpeechConfig.FromEndpoint(new Uri(_speechConfig.EndpointId), _speechConfig.SubscriptionKey);
                         specializedConfig.SetProperty("SpeechServiceResponse_Detailed", "true");
                         specializedConfig.EnableAudioLogging();
@@ -192,73 +360,125 @@ namespace SpeechTranslator.Services
             return response;
         }
 
-        private string ExtractAudioFromVideo(string videoFilePath)
+        public async Task<ReadOnlyMemory<byte>> ExtractPcmAudioAsync(string videoFilePath)
         {
-            string audioFilePath = Path.ChangeExtension(videoFilePath, ".wav");
+            // A source that is already 16kHz mono 16-bit PCM WAV only needs its header stripped
+            var wavSamples = await TryReadWavSamplesAsync(videoFilePath);
+            if (wavSamples != null)
+            {
+                _logger.LogInformation("Source is already speech-ready WAV, skipping FFmpeg decode");
+                return wavSamples;
+            }
 
-            try
+            // Decode the whole soundtrack once into 16kHz mono 16-bit PCM so callers can
+            // slice segments out of memory instead of running FFmpeg again for each one
+            var processInfo = new System.Diagnostics.ProcessStartInfo
             {
-                // Use more optimized FFmpeg settings for speech recognition
-                // -ac 1: Convert to mono (single audio channel)
-                // -ar 16000: Sample rate of 16kHz (good for speech)
-                // -vn: Disable video
-                // -q:a 0: Highest audio quality
-                // -af "loudnorm=I=-16:TP=-1.5:LRA=11": Normalize audio levels for better speech recognition
-                string ffmpegCommand = 
-                    $"ffmpeg -i \"{videoFilePath}\" -ac 1 -ar 16000 -vn -q:a 0 " +
-                    $"-af \"loudnorm=I=-16:TP=-1.5:LRA=11\" \"{audioFilePath}\" -y";
-
-                // Execute the command
-                var process = new System.Diagnostics.Process
+                FileName = FfmpegPath,
+                ArgumentList =
                 {
-                    StartInfo = new System.Diagnostics.ProcessStartInfo
-                    {
-                        FileName = "cmd.exe",
-                        Arguments = $"/C {ffmpegCommand}",
-                        RedirectStandardOutput = true,
-                        RedirectStandardError = true,
-                        UseShellExecute = false,
-                        CreateNoWindow = true
-                    }
-                };
+                    "-i", videoFilePath, "-ac", "1", "-ar", "16000", "-vn",
+                    "-af", "loudnorm=I=-16:TP=-1.5:LRA=11", "-acodec", "pcm_s16le", "-f", "s16le", "pipe:1"
+                },
+                RedirectStandardOutput = true,
+                RedirectStandardError = true,
+                UseShellExecute = false,
+                CreateNoWindow = true
+            };
 
-                process.Start();
-                
-                // Read the error output for debugging
-                string stderr = process.StandardError.ReadToEnd();
-                process.WaitForExit();
+            using var process = System.Diagnostics.Process.Start(processInfo);
+            if (process == null)
+            {
+                _logger.LogError("Failed to start FFmpeg process for audio extraction");
+                return ReadOnlyMemory<byte>.Empty;
+            }
 
-                if (process.ExitCode != 0)
-                {
-                    Console.WriteLine($"FFmpeg error output: {stderr}");
-                    throw new Exception($"Failed to extract audio from video. FFmpeg error code: {process.ExitCode}");
-                }
+            using var pcmStream = new MemoryStream();
+            var stderrTask = process.StandardError.ReadToEndAsync();
+            await process.StandardOutput.BaseStream.CopyToAsync(pcmStream);
+            await process.WaitForExitAsync();
 
-                Console.WriteLine($"Successfully extracted audio to {audioFilePath}");
-                return audioFilePath;
+            if (process.ExitCode != 0)
+            {
+                _logger.LogError("FFmpeg audio extraction failed: {Error}", await stderrTask);
+                return ReadOnlyMemory<byte>.Empty;
             }
-            catch (Exception ex)
+
+            // Hand out the stream's own buffer instead of copying the whole soundtrack again
+            return new ReadOnlyMemory<byte>(pcmStream.GetBuffer(), 0, (int)pcmStream.Length);
+        }
+
+        private static async Task<byte[]?> TryReadWavSamplesAsync(string filePath)
+        {
+            // The file is opened once. Its leading chunks are read and checked first, and only a WAV in the
+            // recognizer's format gets a full-size buffer, filled through the same handle
+            await using var file = new FileStream(filePath, FileMode.Open, FileAccess.Read, FileShare.Read, bufferSize: 1, FileOptions.SequentialScan);
+            var header = new byte[(int)Math.Min(file.Length, WavHeaderProbeBytes)];
+            int headerRead = await file.ReadAtLeastAsync(header, header.Length, throwOnEndOfStream: false);
+            if (!PcmAudio.TryFindWavData(header.AsSpan(0, headerRead), out int dataOffset, out uint dataLength))
             {
-                Console.WriteLine($"Error extracting audio: {ex.Message}");
-                throw;
+                return null;
             }
+
+            // Streamed WAVs may carry a placeholder size, so never size past the end of the file
+            long sampleBytes = Math.Min(dataLength, file.Length - dataOffset);
+            if (sampleBytes > Array.MaxLength)
+            {
+                return null;
+            }
+
+            var samples = new byte[sampleBytes];
+            int buffered = (int)Math.Min(sampleBytes, headerRead - dataOffset);
+            header.AsSpan(dataOffset, buffered).CopyTo(samples);
+            int read = buffered + await file.ReadAtLeastAsync(samples.AsMemory(buffered), samples.Length - buffered, throwOnEndOfStream: false);
+            return read == samples.Length ? samples : samples[..read];
+        }
+
+        /// <summary>
+        /// Returns true when the file starts with a RIFF/WAVE header, i.e. it is audio with no video frames.
+        /// </summary>
+        public static async Task<bool> IsRiffWaveAsync(string filePath)
+        {
+            // Only the 12-byte RIFF header is read, so probing a video file costs next to nothing
+            var header = new byte[12];
+            await using var file = File.OpenRead(filePath);
+            return await file.ReadAtLeastAsync(header, header.Length, throwOnEndOfStream: false) == header.Length &&
+                header.AsSpan(0, 4).SequenceEqual("RIFF"u8) &&
+                header.AsSpan(8, 4).SequenceEqual("WAVE"u8);
         }
 
         public async IAsyncEnumerable<(string Original, string Translated, bool IsInterim)> GetSpeechStreamAsync(string sourceLanguage, string targetLanguage)
         {
-            _speechRecognizer = new SpeechRecognizer(_speechConfig);
-            _speechSynthesizer = new SpeechSynthesizer(_speechConfig);
+            _speechRecognizer = new SpeechRecognizer(_liveSpeechConfig);
 
             // Clear previous accumulated text when starting a new session
             _accumulatedOriginalText.Clear();
             _accumulatedTranslatedText.Clear();
             _lastInterimText = string.Empty;
 
-            var translationPairs = new Queue<(string Original, string Translated, bool IsInterim)>();
-            _isListening = true;
+            // Recognizer callbacks only queue text; a separate stage translates it, so a slow translation
+            // never holds up recognition and results stay in the order they were recognized
+            var recognizedTexts = Channel.CreateUnbounded<(string Text, bool IsInterim, string ResultId)>(
+                new UnboundedChannelOptions { SingleReader = true });
+            var translationPairs = Channel.CreateUnbounded<(string Original, string Translated, bool IsInterim)>(
+                new UnboundedChannelOptions { SingleReader = true, SingleWriter = true });
+            _recognizedTexts = recognizedTexts;
+
+            // Decide once per session whether results need translating, rather than on every recognizer event
+            Func<string, Task<string>> translate = sourceLanguage.Equals(targetLanguage, StringComparison.OrdinalIgnoreCase)
+                ? text => Task.FromResult(text)
+                : TranslateTimedAsync;
+
+            async Task<string> TranslateTimedAsync(string text)
+            {
+                var translationTimer = Stopwatch.StartNew();
+                string translated = await _translationService.TranslateTextAsync(sourceLanguage, targetLanguage, text);
+                _latencyTracker.RecordTranslationLatency(translationTimer.Elapsed.TotalMilliseconds);
+                return translated;
+            }
 
             // Handle interim results (while speaking)
-            _speechRecognizer.Recognizing += async (s, e) =>
+            _speechRecognizer.Recognizing += (s, e) =>
             {
                 var resultId = e.Result.ResultId;
                 if (!string.IsNullOrWhiteSpace(resultId) && _activeRecognitions.TryAdd(resultId, RecognitionStage.InterimPending))
@@ -270,121 +490,152 @@ namespace SpeechTranslator.Services
                 if (!string.IsNullOrWhiteSpace(e.Result.Text) && e.Result.Text != _lastInterimText)
                 {
                     _lastInterimText = e.Result.Text;
-                    Console.WriteLine($"Interim Recognized: {e.Result.Text}");
-                    
-                    // Translate the interim result
-                    try
-                    {
-                        string interimText = e.Result.Text;
-                        var translationTimer = Stopwatch.StartNew();
-                        string translatedText = await _translationService.TranslateTextAsync(sourceLanguage, targetLanguage, interimText);
-                        translationTimer.Stop();
-                        _latencyTracker.RecordTranslationLatency(translationTimer.Elapsed.TotalMilliseconds);
-                        
-                        // Queue the interim result with the IsInterim flag set to true
-                        translationPairs.Enqueue((interimText, translatedText, true));
-
-                        if (!string.IsNullOrWhiteSpace(resultId) &&
-                            _activeRecognitions.TryGetValue(resultId, out var stage) &&
-                            stage == RecognitionStage.InterimPending)
-                        {
-                            var latency = _latencyTracker.EndTracking(resultId);
-                            if (latency.HasValue)
-                            {
-                                _logger.LogInformation("Interim speech recognition latency: {Latency}ms for result {ResultId}", latency.Value, resultId);
-                            }
-
-                            _latencyTracker.StartTracking(resultId);
-                            _activeRecognitions[resultId] = RecognitionStage.FinalPending;
-                        }
-                    }
-                    catch (Exception ex)
-                    {
-                        Console.WriteLine($"Error translating interim text: {ex.Message}");
-                    }
+                    _logger.LogDebug("Interim Recognized: {Text}", e.Result.Text);
+                    recognizedTexts.Writer.TryWrite((e.Result.Text, true, resultId));
                 }
             };
 
             // Handle final results (after pauses)
-            _speechRecognizer.Recognized += async (s, e) =>
+            _speechRecognizer.Recognized += (s, e) =>
             {
-                if (!string.IsNullOrWhiteSpace(e.Result.Text))
+                _lastInterimText = string.Empty; // Reset interim tracking
+                recognizedTexts.Writer.TryWrite((e.Result.Text ?? string.Empty, false, e.Result.ResultId));
+            };
+
+            var translationStage = TranslateRecognizedTextsAsync();
+
+            async Task TranslateRecognizedTextsAsync()
+            {
+                // Last interim text that finished translating, reused when the final result is identical
+                (string Original, string Translated) lastInterimTranslation = (string.Empty, string.Empty);
+                var reader = recognizedTexts.Reader;
+
+                try
                 {
-                    string originalText = e.Result.Text;
-                    _lastInterimText = string.Empty; // Reset interim tracking
-                    
-                    try
+                    await foreach (var (text, isInterim, resultId) in reader.ReadAllAsync())
                     {
-                        var translationTimer = Stopwatch.StartNew();
-                        string translatedText = await _translationService.TranslateTextAsync(sourceLanguage, targetLanguage, originalText);
-                        translationTimer.Stop();
-                        _latencyTracker.RecordTranslationLatency(translationTimer.Elapsed.TotalMilliseconds);
-                        
-                        Console.WriteLine($"Original: {originalText}");
-                        Console.WriteLine($"Translated: {translatedText}");
-                        
-                        // Accumulate the final text
-                        if (_accumulatedOriginalText.Length > 0)
+                        if (isInterim)
                         {
-                            _accumulatedOriginalText.Append(" ");
-                            _accumulatedTranslatedText.Append(" ");
+                            // A newer result is already queued, so this hypothesis would be replaced before it is seen
+                            if (reader.TryPeek(out _))
+                            {
+                                continue;
+                            }
+
+                            try
+                            {
+                                string translatedText = await translate(text);
+                                lastInterimTranslation = (text, translatedText);
+
+                                // Queue the interim result with the IsInterim flag set to true
+                                translationPairs.Writer.TryWrite((text, translatedText, true));
+
+                                if (!string.IsNullOrWhiteSpace(resultId) &&
+                                    _activeRecognitions.TryGetValue(resultId, out var stage) &&
+                                    stage == RecognitionStage.InterimPending)
+                                {
+                                    var latency = _latencyTracker.EndTracking(resultId);
+                                    if (latency.HasValue)
+                                    {
+                                        _logger.LogInformation("Interim speech recognition latency: {Latency}ms for result {ResultId}", latency.Value, resultId);
+                                    }
+
+                                    _latencyTracker.StartTracking(resultId);
+                                    _activeRecognitions[resultId] = RecognitionStage.FinalPending;
+                                }
+                            }
+                            catch (Exception ex)
+                            {
+                                Console.WriteLine($"Error translating interim text: {ex.Message}");
+                            }
+                            continue;
                         }
-                        _accumulatedOriginalText.Append(originalText);
-                        _accumulatedTranslatedText.Append(translatedText);
-                        
-                        // Store both original and translated text with IsInterim flag set to false
-                        translationPairs.Enqueue((originalText, translatedText, false));
-                    }
-                    catch (Exception ex)
-                    {
-                        Console.WriteLine($"Error translating final text: {ex.Message}");
-                    }
-                }
 
-                var resultId = e.Result.ResultId;
-                if (!string.IsNullOrWhiteSpace(resultId))
-                {
-                    if (_activeRecognitions.TryRemove(resultId, out var stage))
-                    {
-                        var latency = _latencyTracker.EndTracking(resultId);
-                        if (latency.HasValue)
+                        if (!string.IsNullOrWhiteSpace(text))
                         {
-                            if (stage == RecognitionStage.FinalPending)
+                            var reusableTranslation = lastInterimTranslation;
+                            lastInterimTranslation = (string.Empty, string.Empty);
+
+                            try
                             {
-                                _logger.LogInformation("Final speech recognition latency: {Latency}ms for result {ResultId}", latency.Value, resultId);
+                                string translatedText;
+                                if (text == reusableTranslation.Original)
+                                {
+                                    // The final result matches the last interim hypothesis, so its translation is already known
+                                    translatedText = reusableTranslation.Translated;
+                                }
+                                else
+                                {
+                                    translatedText = await translate(text);
+                                }
+
+                                _logger.LogInformation("Original: {Original} | Translated: {Translated}", text, translatedText);
+
+                                // Accumulate the final text
+                                if (_accumulatedOriginalText.Length > 0)
+                                {
+                                    _accumulatedOriginalText.Append(" ");
+                                    _accumulatedTranslatedText.Append(" ");
+                                }
+                                _accumulatedOriginalText.Append(text);
+                                _accumulatedTranslatedText.Append(translatedText);
+
+                                // Store both original and translated text with IsInterim flag set to false
+                                translationPairs.Writer.TryWrite((text, translatedText, false));
+                            }
+                            catch (Exception ex)
+                            {
+                                Console.WriteLine($"Error translating final text: {ex.Message}");
+                            }
+                        }
+
+                        if (!string.IsNullOrWhiteSpace(resultId))
+                        {
+                            if (_activeRecognitions.TryRemove(resultId, out var stage))
+                            {
+                                var latency = _latencyTracker.EndTracking(resultId);
+                                if (latency.HasValue)
+                                {
+                                    if (stage == RecognitionStage.FinalPending)
+                                    {
+                                        _logger.LogInformation("Final speech recognition latency: {Latency}ms for result {ResultId}", latency.Value, resultId);
+                                    }
+                                    else
+                                    {
+                                        _logger.LogInformation("Speech recognition latency without interim translation: {Latency}ms for result {ResultId}", latency.Value, resultId);
+                                    }
+                                }
                             }
                             else
                             {
-                                _logger.LogInformation("Speech recognition latency without interim translation: {Latency}ms for result {ResultId}", latency.Value, resultId);
+                                _latencyTracker.CancelTracking(resultId);
                             }
                         }
                     }
-                    else
-                    {
-                        _latencyTracker.CancelTracking(resultId);
-                    }
                 }
-            };
+                finally
+                {
+                    // Lets the consumer below finish once everything recognized before stopping has been sent
+                    translationPairs.Writer.TryComplete();
+                }
+            }
 
             await _speechRecognizer.StartContinuousRecognitionAsync();
 
-            while (_isListening)
+            // Results are pushed as soon as they are translated; the channel completes when listening stops
+            await foreach (var pair in translationPairs.Reader.ReadAllAsync())
             {
-                while (translationPairs.Count > 0)
-                {
-                    yield return translationPairs.Dequeue();
-                }
-
-                await Task.Delay(10); // Reduced delay for more responsive processing
+                yield return pair;
             }
 
+            await translationStage;
             await _speechRecognizer.StopContinuousRecognitionAsync();
             yield break;
         }
 
         public async Task StopListeningAsync()
         {
-            _isListening = false;
+            _recognizedTexts?.Writer.TryComplete();
 
             foreach (var pendingId in _activeRecognitions.Keys)
             {
@@ -402,11 +653,6 @@ namespace SpeechTranslator.Services
                 await _speechRecognizer.StopContinuousRecognitionAsync();
                 _speechRecognizer.Dispose();
             }
-
-            if (_speechSynthesizer != null)
-            {
-                _speechSynthesizer.Dispose();
-            }
         }
 
         // Add method to get the full accumulated text
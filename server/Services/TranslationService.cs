@@ -1,45 +1,179 @@
 using Azure;
 using Azure.AI.Translation.Text;
 using Azure.Core;
+using Azure.Core.Pipeline;
 using System;
+using System.Net.Http;
 using System.Threading.Tasks;
 using System.Collections.Generic;
+using System.Linq;
 
 namespace SpeechTranslator.Services
 {
     public class TranslationService
     {
+        /// <summary>
+        /// Maximum number of translations kept in the in-memory cache.
+        /// </summary>
+        private const int CacheCapacity = 4096;
+
+        /// <summary>
+        /// Per-request limits of the Translator service for the number of texts and their combined length.
+        /// </summary>
+        private const int MaxBatchSize = 100;
+        private const int MaxBatchCharacters = 50000;
+
+        /// <summary>
+        /// Connection pool and retry settings for the Translator client. Captions translate every few
+        /// seconds, so warm connections are kept open and transient failures get short, bounded retries.
+        /// </summary>
+        private const int MaxConnectionsPerServer = 8;
+        private const int MaxRetries = 2;
+        private static readonly TimeSpan RetryDelay = TimeSpan.FromMilliseconds(200);
+
         private readonly TextTranslationClient _client;
 
+        /// <summary>
+        /// Recently used translations keyed by language pair and text, with the least recently used at the front.
+        /// </summary>
+        private readonly Dictionary<CacheKey, LinkedListNode<(CacheKey Key, string Translation)>> _cache = new();
+        private readonly LinkedList<(CacheKey Key, string Translation)> _cacheOrder = new();
+        private readonly object _cacheLock = new();
+
+        private readonly record struct CacheKey(string SourceLanguage, string TargetLanguage, string Text);
+
         public TranslationService(string translatorKey, string translatorEndpoint, string translatorRegion)
         {
-            _client = new TextTranslationClient(new AzureKeyCredential(translatorKey), new Uri(translatorEndpoint), translatorRegion);
+            _client = new TextTranslationClient(new AzureKeyCredential(translatorKey), new Uri(translatorEndpoint), translatorRegion, CreateClientOptions());
+        }
+
+        private static TextTranslationClientOptions CreateClientOptions()
+        {
+            var options = new TextTranslationClientOptions
+            {
+                Transport = new HttpClientTransport(new SocketsHttpHandler
+                {
+                    MaxConnectionsPerServer = MaxConnectionsPerServer,
+                    PooledConnectionIdleTimeout = TimeSpan.FromMinutes(2),
+                    // Recycle long-lived connections so DNS changes are still picked up
+                    PooledConnectionLifetime = TimeSpan.FromMinutes(10)
+                })
+            };
+            options.Retry.Mode = RetryMode.Exponential;
+            options.Retry.MaxRetries = MaxRetries;
+            options.Retry.Delay = RetryDelay;
+            return options;
         }
 
         public async Task<string> TranslateTextAsync(string sourceLang, string targetLanguage, string text)
         {
-            if (sourceLang.Equals(targetLanguage, StringComparison.OrdinalIgnoreCase))
+            var translations = await TranslateTextsAsync(sourceLang, targetLanguage, [text]);
+            return translations[0];
+        }
+
+        public async Task<IReadOnlyList<string>> TranslateTextsAsync(string sourceLang, string targetLanguage, IReadOnlyList<string> texts)
+        {
+            if (texts.Count == 0 || sourceLang.Equals(targetLanguage, StringComparison.OrdinalIgnoreCase))
+            {
+                return texts;
+            }
+
+            // Group uncached texts so a repeated line is only sent once
+            var results = new string[texts.Count];
+            var misses = new Dictionary<string, List<int>>();
+            for (int i = 0; i < texts.Count; i++)
             {
-                return text;
+                if (TryGetCachedTranslation(new CacheKey(sourceLang, targetLanguage, texts[i]), out var cached))
+                {
+                    results[i] = cached;
+                }
+                else if (misses.TryGetValue(texts[i], out var positions))
+                {
+                    positions.Add(i);
+                }
+                else
+                {
+                    misses[texts[i]] = new List<int> { i };
+                }
             }
 
-            var response = await _client.TranslateAsync([targetLanguage], [text], sourceLanguage: sourceLang);
-            return response.Value[0].Translations[0].Text;
+            var pending = misses.Keys.ToList();
+            int offset = 0;
+            while (offset < pending.Count)
+            {
+                // Each request carries as many uncached texts as the Translator limits allow;
+                // translations come back in input order
+                int count = 0;
+                int characters = 0;
+                while (offset + count < pending.Count && count < MaxBatchSize &&
+                       (count == 0 || characters + pending[offset + count].Length <= MaxBatchCharacters))
+                {
+                    characters += pending[offset + count].Length;
+                    count++;
+                }
+
+                var batch = pending.GetRange(offset, count);
+                var response = await _client.TranslateAsync([targetLanguage], batch, sourceLanguage: sourceLang);
+                for (int j = 0; j < batch.Count; j++)
+                {
+                    var translated = response.Value[j].Translations[0].Text;
+                    foreach (int position in misses[batch[j]])
+                    {
+                        results[position] = translated;
+                    }
+                    CacheTranslation(new CacheKey(sourceLang, targetLanguage, batch[j]), translated);
+                }
+
+                offset += count;
+            }
+
+            return results;
         }
 
         public async IAsyncEnumerable<string> TranslateTextStreamAsync(string sourceLang, string targetLanguage, IAsyncEnumerable<string> textStream)
         {
             await foreach (var text in textStream)
             {
-                if (sourceLang.Equals(targetLanguage, StringComparison.OrdinalIgnoreCase))
+                // Same cached path as single translations, so repeated phrases in a stream skip the service
+                yield return await TranslateTextAsync(sourceLang, targetLanguage, text);
+            }
+        }
+
+        private bool TryGetCachedTranslation(CacheKey key, out string translation)
+        {
+            lock (_cacheLock)
+            {
+                if (_cache.TryGetValue(key, out var node))
                 {
-                    yield return text;
+                    // Mark as most recently used
+                    _cacheOrder.Remove(node);
+                    _cacheOrder.AddLast(node);
+                    translation = node.Value.Translation;
+                    return true;
                 }
-                else
+            }
+
+            translation = string.Empty;
+            return false;
+        }
+
+        private void CacheTranslation(CacheKey key, string translation)
+        {
+            lock (_cacheLock)
+            {
+                if (_cache.TryGetValue(key, out var existing))
                 {
-                    var response = await _client.TranslateAsync([targetLanguage], [text], sourceLanguage: sourceLang);
-                    yield return response.Value[0].Translations[0].Text;
+                    _cacheOrder.Remove(existing);
                 }
+                else if (_cache.Count >= CacheCapacity)
+                {
+                    // Evict the least recently used translation
+                    var oldest = _cacheOrder.First!;
+                    _cacheOrder.RemoveFirst();
+                    _cache.Remove(oldest.Value.Key);
+                }
+
+                _cache[key] = _cacheOrder.AddLast((key, translation));
             }
         }
     }
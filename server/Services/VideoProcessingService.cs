@@ -12,22 +12,42 @@ using System.Drawing.Text;
 using System.IO;
 using System.Linq;
 using System.Text;
+using System.Text.RegularExpressions;
+using System.Threading;
 using System.Threading.Tasks;
 
 namespace SpeechTranslator.Services
 {
     public class VideoProcessingService
     {
-        private readonly string _visionApiKey;
-        private readonly string _visionEndpoint;
+        private readonly ImageAnalysisClient _imageAnalysisClient;
         private readonly TranslationService _translationService;
     private readonly LatencyTracker _latencyTracker;
         private readonly ILogger<VideoProcessingService> _logger;
         private bool _isProcessing;
         private VideoCapture? _videoCapture;
         
-        // Track detected text regions and their translations
+        // Stopping cancels the frame loop and waits for it to finish, instead of guessing how long it needs
+        private CancellationTokenSource? _processingCts;
+        private Task _processingTask = Task.CompletedTask;
+        
+        // Detected text regions, their translations and rendered overlays (BGR text plus alpha mask) for the
+        // uploaded video; only the frame loop touches these, live frames keep their own per call
         private readonly Dictionary<Rectangle, (string Original, string Translated)> _textRegions = new();
+        private readonly Dictionary<Rectangle, (Mat Text, Mat Mask)> _renderedOverlays = new();
+        
+        // GDI+ objects aren't thread-safe, so each thread keeps its own overlay fonts (one per size) and text format
+        [ThreadStatic] private static Dictionary<float, Font>? _overlayFonts;
+        [ThreadStatic] private static StringFormat? _centeredFormat;
+        
+        private static readonly ImageEncodingParam[] FrameEncodingParams = { new(ImwriteFlags.JpegQuality, 80) };
+        
+        // Matches each non-ASCII UTF-16 character; compiled once instead of rebuilding the string per character
+        private static readonly Regex NonAsciiCharacter = new(@"[^\x00-\x7F]", RegexOptions.Compiled);
+        
+        // OCR options depend only on the source language; only the last language's options are kept, and a
+        // different language replaces them, so the cache never grows with client-supplied language codes
+        private Tuple<string, ImageAnalysisOptions>? _analysisOptions;
 
         public VideoProcessingService(
             string visionApiKey,
@@ -36,8 +56,8 @@ namespace SpeechTranslator.Services
             LatencyTracker latencyTracker,
             ILogger<VideoProcessingService> logger)
         {
-            _visionApiKey = visionApiKey;
-            _visionEndpoint = visionEndpoint;
+            // One client for the service lifetime so its HTTP connections are pooled and kept alive across frames
+            _imageAnalysisClient = new ImageAnalysisClient(new Uri(visionEndpoint), new AzureKeyCredential(visionApiKey));
             _translationService = translationService;
             _latencyTracker = latencyTracker;
             _logger = logger;
@@ -63,12 +83,15 @@ namespace SpeechTranslator.Services
                 }
 
                 _isProcessing = true;
-                _textRegions.Clear();
+                
+                _processingCts?.Dispose();
+                _processingCts = new CancellationTokenSource();
+                var cancellationToken = _processingCts.Token;
                 
                 // Start processing in a background task
-                _ = Task.Run(async () => 
+                _processingTask = Task.Run(async () => 
                 {
-                    await ProcessVideoFramesAsync(sourceLanguage, targetLanguage, hubContext);
+                    await ProcessVideoFramesAsync(sourceLanguage, targetLanguage, hubContext, cancellationToken);
                 });
                 
                 return Task.FromResult(true);
@@ -80,7 +103,7 @@ namespace SpeechTranslator.Services
             }
         }
 
-        private async Task ProcessVideoFramesAsync(string sourceLanguage, string targetLanguage, IHubContext<TranslationHub> hubContext)
+        private async Task ProcessVideoFramesAsync(string sourceLanguage, string targetLanguage, IHubContext<TranslationHub> hubContext, CancellationToken cancellationToken)
         {
             if (_videoCapture == null || !_videoCapture.IsOpened())
             {
@@ -108,11 +131,39 @@ namespace SpeechTranslator.Services
                 // Process every 30th frame for OCR (adjust based on performance needs)
                 int frameSkipRate = 30;
                 int frameCount = 0;
+                int nextOcrFrame = 1;
+                
+                // Frames are scheduled against a playback clock; when processing falls behind,
+                // stale frames are dropped so clients keep seeing the current part of the video
+                var playbackClock = Stopwatch.StartNew();
+                int droppedFrames = 0;
+                double lastDropLogMs = double.MinValue;
+                
+                // Decode into and draw onto the same two buffers for the whole video rather than
+                // allocating fresh frame-sized Mats every frame (Read/CopyTo reuse matching storage)
+                using var frame = new Mat();
+                using var processedFrame = new Mat();
 
-                while (_isProcessing)
+                while (!cancellationToken.IsCancellationRequested)
                 {
+                    double elapsedMs = playbackClock.Elapsed.TotalMilliseconds;
+                    int dueFrame = (int)(elapsedMs / frameDelay) + 1;
+                    
+                    // Grab() advances without decoding, so skipping late frames is cheap
+                    while (frameCount + 1 < dueFrame && _videoCapture.Grab())
+                    {
+                        frameCount++;
+                        droppedFrames++;
+                    }
+                    
+                    if (droppedFrames > 0 && elapsedMs - lastDropLogMs >= 1000)
+                    {
+                        _logger.LogWarning($"Video processing is behind schedule, dropped {droppedFrames} stale frames");
+                        droppedFrames = 0;
+                        lastDropLogMs = elapsedMs;
+                    }
+                    
                     var overlayTimer = Stopwatch.StartNew();
-                    using var frame = new Mat();
                     if (!_videoCapture.Read(frame) || frame.Empty())
                     {
                         _logger.LogInformation("End of video reached");
@@ -121,14 +172,15 @@ namespace SpeechTranslator.Services
 
                     frameCount++;
                     
-                    // Process text detection every Nth frame
-                    if (frameCount % frameSkipRate == 1)
+                    // Process text detection every Nth frame (counting dropped frames too)
+                    if (frameCount >= nextOcrFrame)
                     {
+                        nextOcrFrame = frameCount + frameSkipRate;
                         await DetectAndTranslateTextInFrameAsync(frame, sourceLanguage, targetLanguage, hubContext);
                     }
                     
                     // Create frame with overlaid translations
-                    using var processedFrame = OverlayTranslationsOnFrame(frame);
+                    OverlayTranslationsOnFrame(frame, processedFrame, _textRegions, _renderedOverlays);
                     
                     // Convert to base64 for sending via SignalR
                     string frameBase64 = ConvertFrameToBase64(processedFrame);
@@ -139,8 +191,19 @@ namespace SpeechTranslator.Services
                     overlayTimer.Stop();
                     _latencyTracker.RecordVideoOverlayLatency(overlayTimer.Elapsed.TotalMilliseconds);
 
-                    // Respect original video frame rate
-                    await Task.Delay((int)frameDelay);
+                    // Respect original video frame rate, minus the time already spent on this frame
+                    double waitMs = frameCount * frameDelay - playbackClock.Elapsed.TotalMilliseconds;
+                    if (waitMs >= 1)
+                    {
+                        try
+                        {
+                            await Task.Delay((int)waitMs, cancellationToken);
+                        }
+                        catch (OperationCanceledException)
+                        {
+                            break;
+                        }
+                    }
                 }
                 
                 // Notify clients that processing is complete
@@ -153,6 +216,8 @@ namespace SpeechTranslator.Services
             }
             finally
             {
+                // Release the cached overlays here, on the loop, so no frame can still be reading them
+                ClearTextRegions();
                 _isProcessing = false;
                 _videoCapture?.Dispose();
                 _videoCapture = null;
@@ -163,38 +228,27 @@ namespace SpeechTranslator.Services
         {
             try
             {
-                // Convert OpenCV Mat to byte array
-                byte[] imageBytes;
-                using (var memoryStream = new MemoryStream())
-                {
-                    frame.WriteToStream(memoryStream);
-                    imageBytes = memoryStream.ToArray();
-                }
-                
-                // Create a client for Azure Computer Vision
-                var credential = new AzureKeyCredential(_visionApiKey);
-                var client = new ImageAnalysisClient(new Uri(_visionEndpoint), credential);
+                // Encode the OpenCV Mat straight to a byte array
+                byte[] imageBytes = frame.ToBytes();
                 
                 // Define visual features for text detection (ReadAPI)
                 var visualFeatures = VisualFeatures.Read;
 
                 // Analyze image to detect text
                 var imageContent = BinaryData.FromBytes(imageBytes);
-                var options = new ImageAnalysisOptions { Language = sourceLanguage };
-                var result = await client.AnalyzeAsync(imageContent, visualFeatures, options);
+                var options = GetAnalysisOptions(sourceLanguage);
+                var result = await _imageAnalysisClient.AnalyzeAsync(imageContent, visualFeatures, options);
                 
                 if (result?.Value?.Read != null)
                 {
-                    // Clear previous text regions for this frame
-                    _textRegions.Clear();
+                    // Collect every text line in the frame so they can be translated in one request
+                    var lines = new List<(string Text, Rectangle BoundingBox)>();
                     
                     // Process text blocks and lines correctly based on API structure
                     foreach (var block in result.Value.Read.Blocks)
                     {
                         foreach (var line in block.Lines)
                         {
-                            string originalText = line.Text;
-                            
                             // Get bounding polygon
                             if (line.BoundingPolygon.Count >= 4)
                             {
@@ -211,26 +265,37 @@ namespace SpeechTranslator.Services
                                     maxY - minY
                                 );
                                 
-                                // Translate the detected text
-                                string translatedText = await _translationService.TranslateTextAsync(
-                                    sourceLanguage, 
-                                    targetLanguage, 
-                                    originalText
-                                );
-                                
-                                // Store the text and its location
-                                _textRegions[boundingBox] = (originalText, translatedText);
-                                
-                                // Notify clients about detected and translated text
-                                await hubContext.Clients.All.SendAsync(
-                                    "TextDetectedInVideo", 
-                                    originalText, 
-                                    translatedText,
-                                    new { X = boundingBox.X, Y = boundingBox.Y, Width = boundingBox.Width, Height = boundingBox.Height }
-                                );
+                                lines.Add((line.Text, boundingBox));
                             }
                         }
                     }
+                    
+                    // Translate all detected lines with a single Translator call
+                    var translations = await _translationService.TranslateTextsAsync(
+                        sourceLanguage, 
+                        targetLanguage, 
+                        lines.Select(l => l.Text).ToList()
+                    );
+                    
+                    // Clear previous text regions for this frame
+                    ClearTextRegions();
+                    
+                    for (int i = 0; i < lines.Count; i++)
+                    {
+                        var (originalText, boundingBox) = lines[i];
+                        string translatedText = translations[i];
+                        
+                        // Store the text and its location
+                        _textRegions[boundingBox] = (originalText, translatedText);
+                        
+                        // Notify clients about detected and translated text
+                        await hubContext.Clients.All.SendAsync(
+                            "TextDetectedInVideo", 
+                            originalText, 
+                            translatedText,
+                            new { X = boundingBox.X, Y = boundingBox.Y, Width = boundingBox.Width, Height = boundingBox.Height }
+                        );
+                    }
                 }
             }
             catch (Exception ex)
@@ -239,12 +304,28 @@ namespace SpeechTranslator.Services
             }
         }
 
-        private Mat OverlayTranslationsOnFrame(Mat frame)
+        private void ClearTextRegions()
         {
-            // Create a copy of the frame to work with
-            var processedFrame = frame.Clone();
+            _textRegions.Clear();
             
-            foreach (var region in _textRegions)
+            foreach (var (text, mask) in _renderedOverlays.Values)
+            {
+                text.Dispose();
+                mask.Dispose();
+            }
+            _renderedOverlays.Clear();
+        }
+
+        private void OverlayTranslationsOnFrame(
+            Mat frame,
+            Mat processedFrame,
+            IReadOnlyDictionary<Rectangle, (string Original, string Translated)> textRegions,
+            Dictionary<Rectangle, (Mat Text, Mat Mask)>? renderedOverlays)
+        {
+            // Copy the frame into the output buffer to draw on, reusing its storage when the size matches
+            frame.CopyTo(processedFrame);
+            
+            foreach (var region in textRegions)
             {
                 var box = region.Key;
                 var (originalText, translatedText) = region.Value;
@@ -260,109 +341,34 @@ namespace SpeechTranslator.Services
                 
                 if (!string.IsNullOrEmpty(translatedText))
                 {
+                    (Mat Text, Mat Mask) overlay = default;
+                    bool cached = false;
                     try
                     {
-                        // Use System.Drawing for Unicode text rendering
-                        using (var bitmap = new Bitmap(box.Width, box.Height))
-                        using (var graphics = Graphics.FromImage(bitmap))
+                        // Text only changes when OCR runs, so with a cache it is rendered once and blended on every frame after
+                        cached = renderedOverlays != null && renderedOverlays.TryGetValue(box, out overlay);
+                        if (!cached)
                         {
-                            // Set up high quality text rendering
-                            graphics.TextRenderingHint = TextRenderingHint.AntiAliasGridFit;
-                            graphics.SmoothingMode = System.Drawing.Drawing2D.SmoothingMode.AntiAlias;
-                            
-                            // Fill with transparent background
-                            graphics.Clear(Color.Transparent);
-                            
-                            // Draw the translated text with appropriate font size based on box size
-                            float fontSize = Math.Max(10, Math.Min(16, box.Height / 2));
-                            using (var font = new Font("Arial", fontSize, FontStyle.Bold))
-                            using (var brush = new SolidBrush(Color.White))
+                            overlay = RenderTextOverlay(box, translatedText);
+                            if (renderedOverlays != null)
                             {
-                                // Position text within the box
-                                var padding = 5;
-                                var textRect = new RectangleF(
-                                    padding, 
-                                    padding, 
-                                    box.Width - (2 * padding),
-                                    box.Height - (2 * padding)
-                                );
-                                
-                                // Create format for center alignment
-                                using (var format = new StringFormat())
-                                {
-                                    format.Alignment = StringAlignment.Center;
-                                    format.LineAlignment = StringAlignment.Center;
-                                    graphics.DrawString(translatedText, font, brush, textRect, format);
-                                }
+                                renderedOverlays[box] = overlay;
+                                cached = true;
                             }
+                        }
+                        
+                        if (!overlay.Text.Empty())
+                        {
+                            var roi = new OpenCvSharp.Rect(box.X, box.Y, overlay.Text.Width, overlay.Text.Height);
                             
-                            // Convert bitmap to OpenCV Mat
-                            using (var memoryStream = new MemoryStream())
+                            // Ensure ROI is within frame boundaries
+                            if (roi.X >= 0 && roi.Y >= 0 && 
+                                roi.X + roi.Width <= processedFrame.Width && 
+                                roi.Y + roi.Height <= processedFrame.Height)
                             {
-                                bitmap.Save(memoryStream, ImageFormat.Png);
-                                memoryStream.Position = 0;
-                                
-                                using (var textMat = Mat.FromImageData(memoryStream.ToArray()))
+                                using (var roiMat = new Mat(processedFrame, roi))
                                 {
-                                    if (!textMat.Empty())
-                                    {
-                                        // Create an ROI for the text overlay
-                                        var roi = new OpenCvSharp.Rect(
-                                            box.X, 
-                                            box.Y,
-                                            Math.Min(textMat.Width, box.Width),
-                                            Math.Min(textMat.Height, box.Height)
-                                        );
-                                        
-                                        // Ensure ROI is within frame boundaries
-                                        if (roi.X >= 0 && roi.Y >= 0 && 
-                                            roi.X + roi.Width <= processedFrame.Width && 
-                                            roi.Y + roi.Height <= processedFrame.Height)
-                                        {
-                                            // Create a mask from alpha channel (if available)
-                                            using (var mask = textMat.Channels() == 4 ? textMat.ExtractChannel(3) : null)
-                                            {
-                                                // Fixed error: Don't assign to a using variable
-                                                Mat textBgr;
-                                                if (textMat.Channels() == 4)
-                                                {
-                                                    textBgr = new Mat();
-                                                    Cv2.CvtColor(textMat, textBgr, ColorConversionCodes.BGRA2BGR);
-                                                }
-                                                else
-                                                {
-                                                    textBgr = textMat.Clone();
-                                                }
-                                                
-                                                using (textBgr) // Add using here after assignment
-                                                {
-                                                    // Create a Mat for the destination ROI
-                                                    using (var roiMat = new Mat(processedFrame, roi))
-                                                    {
-                                                        // Resize text image to match ROI
-                                                        using (var resizedText = new Mat())
-                                                        {
-                                                            Cv2.Resize(textBgr, resizedText, new OpenCvSharp.Size(roi.Width, roi.Height));
-                                                            
-                                                            if (mask != null)
-                                                            {
-                                                                using (var resizedMask = new Mat())
-                                                                {
-                                                                    Cv2.Resize(mask, resizedMask, new OpenCvSharp.Size(roi.Width, roi.Height));
-                                                                    resizedText.CopyTo(roiMat, resizedMask);
-                                                                }
-                                                            }
-                                                            else
-                                                            {
-                                                                // If no alpha channel, just copy directly
-                                                                resizedText.CopyTo(roiMat);
-                                                            }
-                                                        }
-                                                    }
-                                                }
-                                            }
-                                        }
-                                    }
+                                    overlay.Text.CopyTo(roiMat, overlay.Mask);
                                 }
                             }
                         }
@@ -383,35 +389,122 @@ namespace SpeechTranslator.Services
                             2
                         );
                     }
+                    finally
+                    {
+                        // Uncached overlays belong to this call only
+                        if (!cached)
+                        {
+                            overlay.Text?.Dispose();
+                            overlay.Mask?.Dispose();
+                        }
+                    }
                 }
             }
-            
-            return processedFrame;
+        }
+
+        private static (Mat Text, Mat Mask) RenderTextOverlay(Rectangle box, string translatedText)
+        {
+            // Use System.Drawing for Unicode text rendering
+            using (var bitmap = new Bitmap(box.Width, box.Height))
+            using (var graphics = Graphics.FromImage(bitmap))
+            {
+                // Set up high quality text rendering
+                graphics.TextRenderingHint = TextRenderingHint.AntiAliasGridFit;
+                graphics.SmoothingMode = System.Drawing.Drawing2D.SmoothingMode.AntiAlias;
+                
+                // Fill with transparent background
+                graphics.Clear(Color.Transparent);
+                
+                // Draw the translated text with appropriate font size based on box size
+                float fontSize = Math.Max(10, Math.Min(16, box.Height / 2));
+                
+                // Position text within the box
+                var padding = 5;
+                var textRect = new RectangleF(
+                    padding, 
+                    padding, 
+                    box.Width - (2 * padding),
+                    box.Height - (2 * padding)
+                );
+                
+                graphics.DrawString(translatedText, GetOverlayFont(fontSize), Brushes.White, textRect, GetCenteredFormat());
+                
+                // Wrap the bitmap's BGRA pixels as an OpenCV Mat in place instead of a PNG encode/decode round trip
+                graphics.Flush();
+                var bitmapData = bitmap.LockBits(
+                    new Rectangle(0, 0, bitmap.Width, bitmap.Height),
+                    ImageLockMode.ReadOnly,
+                    PixelFormat.Format32bppArgb);
+                try
+                {
+                    using (var textMat = new Mat(bitmap.Height, bitmap.Width, MatType.CV_8UC4, bitmapData.Scan0, bitmapData.Stride))
+                    {
+                        // Split into owned BGR pixels and an alpha mask so nothing refers to the bitmap once it is freed
+                        var text = new Mat();
+                        Cv2.CvtColor(textMat, text, ColorConversionCodes.BGRA2BGR);
+                        return (text, textMat.ExtractChannel(3));
+                    }
+                }
+                finally
+                {
+                    bitmap.UnlockBits(bitmapData);
+                }
+            }
+        }
+        
+        private ImageAnalysisOptions GetAnalysisOptions(string sourceLanguage)
+        {
+            // The pair is swapped as one reference, so concurrent callers never see a mismatched language
+            var cached = _analysisOptions;
+            if (cached == null || !string.Equals(cached.Item1, sourceLanguage, StringComparison.OrdinalIgnoreCase))
+            {
+                cached = Tuple.Create(sourceLanguage, new ImageAnalysisOptions { Language = sourceLanguage });
+                _analysisOptions = cached;
+            }
+            return cached.Item2;
+        }
+
+        private static Font GetOverlayFont(float size)
+        {
+            var fonts = _overlayFonts ??= new Dictionary<float, Font>();
+            if (!fonts.TryGetValue(size, out var font))
+            {
+                font = new Font("Arial", size, FontStyle.Bold);
+                fonts[size] = font;
+            }
+            return font;
+        }
+
+        private static StringFormat GetCenteredFormat()
+        {
+            // Create format for center alignment
+            return _centeredFormat ??= new StringFormat
+            {
+                Alignment = StringAlignment.Center,
+                LineAlignment = StringAlignment.Center
+            };
         }
         
         private string ReplaceNonAsciiWithDots(string text)
         {
             // Replace non-ASCII characters with dots as a fallback
-            return string.Join("", text.Select(c => c < 128 ? c : '.'));
+            return NonAsciiCharacter.Replace(text, ".");
         }
 
         private string ConvertFrameToBase64(Mat frame)
         {
-            using var memoryStream = new MemoryStream();
-            frame.WriteToStream(memoryStream);
-            byte[] imageBytes = memoryStream.ToArray();
+            // Frames sent to clients are JPEG: several times smaller than PNG for video content, which
+            // keeps each SignalR message (and its base64 expansion) small. OCR input stays lossless PNG.
+            byte[] imageBytes = frame.ToBytes(".jpg", FrameEncodingParams);
             return Convert.ToBase64String(imageBytes);
         }
 
         public async Task StopVideoProcessingAsync()
         {
-            _isProcessing = false;
-            
-            // Give time for the processing loop to exit gracefully
-            await Task.Delay(100);
+            _processingCts?.Cancel();
             
-            _videoCapture?.Dispose();
-            _videoCapture = null;
+            // Wait for the processing loop to exit; it releases the video capture on its way out
+            await _processingTask;
         }
 
         public async Task<(string ProcessedFrameBase64, List<object> DetectedTexts)> ProcessLiveFrameAsync(
@@ -419,10 +512,12 @@ namespace SpeechTranslator.Services
         {
             var detectedTexts = new List<object>();
             
+            // Regions are per call so concurrent connections never share or clear each other's overlays
+            var textRegions = new Dictionary<Rectangle, (string Original, string Translated)>();
+            
             try
             {
                 // Convert byte array to OpenCV Mat
-                using var frameData = new Mat();
                 using var stream = new MemoryStream(frameBytes);
                 using var frame = Mat.FromStream(stream, ImreadModes.Color);
                 
@@ -432,30 +527,24 @@ namespace SpeechTranslator.Services
                     return ("", detectedTexts);
                 }
                 
-                // Create a credential for Azure Computer Vision
-                var credential = new AzureKeyCredential(_visionApiKey);
-                var client = new ImageAnalysisClient(new Uri(_visionEndpoint), credential);
-                
                 // Define visual features for text detection
                 var visualFeatures = VisualFeatures.Read;
                 
                 // Analyze image to detect text
                 var imageContent = BinaryData.FromBytes(frameBytes);
-                var options = new ImageAnalysisOptions { Language = sourceLanguage };
-                var result = await client.AnalyzeAsync(imageContent, visualFeatures, options);
+                var options = GetAnalysisOptions(sourceLanguage);
+                var result = await _imageAnalysisClient.AnalyzeAsync(imageContent, visualFeatures, options);
                 
                 // Process detected text and translate it
                 if (result?.Value?.Read != null)
                 {
-                    // Clear previous text regions before processing this frame
-                    _textRegions.Clear();
+                    // Collect every text line in the frame so they can be translated in one request
+                    var lines = new List<(string Text, Rectangle BoundingBox)>();
                     
                     foreach (var block in result.Value.Read.Blocks)
                     {
                         foreach (var line in block.Lines)
                         {
-                            string originalText = line.Text;
-                            
                             // Get bounding polygon
                             if (line.BoundingPolygon.Count >= 4)
                             {
@@ -472,37 +561,46 @@ namespace SpeechTranslator.Services
                                     maxY - minY
                                 );
                                 
-                                // Translate the detected text
-                                string translatedText = await _translationService.TranslateTextAsync(
-                                    sourceLanguage, 
-                                    targetLanguage, 
-                                    originalText
-                                );
-                                
-                                // Store the text and its location
-                                _textRegions[boundingBox] = (originalText, translatedText);
-                                
-                                // Add to result list
-                                detectedTexts.Add(new
-                                {
-                                    id = Guid.NewGuid().ToString(),
-                                    originalText,
-                                    translatedText,
-                                    boundingBox = new 
-                                    {
-                                        x = boundingBox.X,
-                                        y = boundingBox.Y,
-                                        width = boundingBox.Width,
-                                        height = boundingBox.Height
-                                    }
-                                });
+                                lines.Add((line.Text, boundingBox));
                             }
                         }
                     }
+                    
+                    // Translate all detected lines with a single Translator call
+                    var translations = await _translationService.TranslateTextsAsync(
+                        sourceLanguage, 
+                        targetLanguage, 
+                        lines.Select(l => l.Text).ToList()
+                    );
+                    
+                    for (int i = 0; i < lines.Count; i++)
+                    {
+                        var (originalText, boundingBox) = lines[i];
+                        string translatedText = translations[i];
+                        
+                        // Store the text and its location
+                        textRegions[boundingBox] = (originalText, translatedText);
+                        
+                        // Add to result list
+                        detectedTexts.Add(new
+                        {
+                            id = Guid.NewGuid().ToString(),
+                            originalText,
+                            translatedText,
+                            boundingBox = new 
+                            {
+                                x = boundingBox.X,
+                                y = boundingBox.Y,
+                                width = boundingBox.Width,
+                                height = boundingBox.Height
+                            }
+                        });
+                    }
                 }
                 
                 // Create frame with overlaid translations
-                using var processedFrame = OverlayTranslationsOnFrame(frame);
+                using var processedFrame = new Mat();
+                OverlayTranslationsOnFrame(frame, processedFrame, textRegions, renderedOverlays: null);
                 
                 // Convert to base64 for sending via SignalR
                 string frameBase64 = ConvertFrameToBase64(processedFrame);
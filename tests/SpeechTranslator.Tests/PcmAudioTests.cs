@@ -0,0 +1,58 @@
+using System.Buffers.Binary;
+using SpeechTranslator.Services;
+using Xunit;
+
+namespace SpeechTranslator.Tests
+{
+    public class PcmAudioTests
+    {
+        [Fact]
+        public void SplitOnSilence_KeepsPauseSeparatedPhrasesAsSeparateSegments()
+        {
+            // Two 2s phrases with a 1s pause between them fit in one 15s segment, but single-shot
+            // recognition would stop at the pause, so each phrase must come back on its own
+            var pcm = BuildAudio((0.5, false), (2, true), (1, false), (2, true), (0.5, false));
+
+            var segments = PcmAudio.SplitOnSilence(pcm, maxSegmentSeconds: 15);
+
+            Assert.Equal(2, segments.Count);
+            Assert.InRange(segments[0].Start, 0.3, 0.5);
+            Assert.InRange(segments[0].Start + segments[0].Duration, 2.5, 2.7);
+            Assert.InRange(segments[1].Start, 3.3, 3.5);
+            Assert.InRange(segments[1].Start + segments[1].Duration, 5.5, 5.7);
+        }
+
+        [Fact]
+        public void SplitOnSilence_CutsSpeechLongerThanTheLimitIntoWindows()
+        {
+            var pcm = BuildAudio((20, true));
+
+            var segments = PcmAudio.SplitOnSilence(pcm, maxSegmentSeconds: 15);
+
+            Assert.Equal(2, segments.Count);
+            Assert.Equal((0.0, 15.0), segments[0]);
+            Assert.Equal(15.0, segments[1].Start, 3);
+            Assert.Equal(5.0, segments[1].Duration, 3);
+        }
+
+        private static byte[] BuildAudio(params (double Seconds, bool Voiced)[] parts)
+        {
+            int totalSamples = parts.Sum(part => (int)(part.Seconds * PcmAudio.SampleRate));
+            var pcm = new byte[totalSamples * PcmAudio.BytesPerSample];
+
+            int sample = 0;
+            foreach (var (seconds, voiced) in parts)
+            {
+                int count = (int)(seconds * PcmAudio.SampleRate);
+                for (int i = 0; i < count; i++, sample++)
+                {
+                    // A 440Hz tone at half scale is well above the silence threshold
+                    short value = voiced ? (short)(short.MaxValue / 2 * Math.Sin(2 * Math.PI * 440 * sample / PcmAudio.SampleRate)) : (short)0;
+                    BinaryPrimitives.WriteInt16LittleEndian(pcm.AsSpan(sample * PcmAudio.BytesPerSample), value);
+                }
+            }
+
+            return pcm;
+        }
+    }
+}
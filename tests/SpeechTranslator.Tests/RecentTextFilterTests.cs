@@ -0,0 +1,18 @@
+using SpeechTranslator.Services;
+using Xunit;
+
+namespace SpeechTranslator.Tests
+{
+    public class RecentTextFilterTests
+    {
+        [Fact]
+        public void TryAdd_TreatsPunctuationAsAWordBreak()
+        {
+            var filter = new RecentTextFilter();
+
+            Assert.True(filter.TryAdd("Well, I think so."));
+            Assert.False(filter.TryAdd("well,I think so"));
+            Assert.False(filter.TryAdd("Well I think  so!"));
+        }
+    }
+}